@@ -0,0 +1,92 @@
+import argparse
+import importlib
+import json
+import platform
+import sys
+
+from benchmarks.harness import CASES
+
+MODULES = [
+    "benchmarks.bench_construction",
+    "benchmarks.bench_combinators",
+    "benchmarks.bench_decorators",
+    "benchmarks.bench_compare",
+    "benchmarks.bench_hash",
+    "benchmarks.bench_pipeline",
+    "benchmarks.bench_arrays",
+    "benchmarks.bench_wire",
+    "benchmarks.bench_instrument",
+    "benchmarks.bench_fold",
+    "benchmarks.bench_iterators",
+    "benchmarks.bench_block",
+]
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("-k", "--filter", default="", help="run matching cases only")
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    parser.add_argument("--json", metavar="PATH", help="write results as JSON")
+    parser.add_argument("--compare", metavar="PATH", help="JSON file of a previous run")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="relative slowdown reported as a regression (default: 0.10)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    for module in MODULES:
+        importlib.import_module(module)
+
+    previous = {}
+    if args.compare:
+        with open(args.compare) as file:
+            previous = {
+                (result["group"], result["name"]): result["ns_per_op"]
+                for result in json.load(file)["results"]
+            }
+
+    results = []
+    regressions = []
+    for case in CASES:
+        if args.filter not in f"{case.group} {case.name}":
+            continue
+        ns = case.measure(args.repeat)
+        line = f"{case.group:<14}{case.name:<40}{ns:>12.1f} ns"
+        before = previous.get((case.group, case.name))
+        if before is not None:
+            change = ns / before - 1
+            line += f"  {change:+7.1%}"
+            if change > args.threshold and not case.baseline:
+                regressions.append(case)
+                line += "  REGRESSION"
+        print(line)
+        results.append(
+            {
+                "group": case.group,
+                "name": case.name,
+                "baseline": case.baseline,
+                "ns_per_op": ns,
+            }
+        )
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "implementation": platform.python_implementation(),
+                    "results": results,
+                },
+                file,
+                indent=2,
+            )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,49 @@
+from benchmarks.harness import BATCH, case
+from src.pyrust_alerycserrania import Err, Ok, as_option
+from src.pyrust_alerycserrania.arrays import OptionArray, ResultArray
+
+OPTIONS = [as_option(None if i % 4 == 0 else i) for i in range(BATCH)]
+RESULTS = [Err(i) if i % 4 == 0 else Ok(i) for i in range(BATCH)]
+OPTION_ARRAY = OptionArray.from_options(OPTIONS)
+RESULT_ARRAY = ResultArray.from_results(RESULTS)
+
+
+def inc(x):
+    return x + 1
+
+
+@case("arrays", "list[Option] map")
+def _():
+    return [option.map(inc) for option in OPTIONS]
+
+
+@case("arrays", "OptionArray.map")
+def _():
+    return OPTION_ARRAY.map(inc)
+
+
+@case("arrays", "list[Option] unwrap_or")
+def _():
+    return [option.unwrap_or(0) for option in OPTIONS]
+
+
+@case("arrays", "OptionArray.unwrap_or")
+def _():
+    return OPTION_ARRAY.unwrap_or(0)
+
+
+@case("arrays", "list[Result] partition")
+def _():
+    oks = [result.value for result in RESULTS if result.is_ok()]
+    errs = [result.error for result in RESULTS if result.is_err()]
+    return oks, errs
+
+
+@case("arrays", "ResultArray.partition")
+def _():
+    return RESULT_ARRAY.partition()
+
+
+@case("arrays", "ResultArray.count_ok")
+def _():
+    return RESULT_ARRAY.count_ok()
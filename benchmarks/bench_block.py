@@ -0,0 +1,80 @@
+from benchmarks.harness import BATCH, case
+from src.pyrust_alerycserrania import Err, Nothing, Ok, Some, result_block
+
+# one failure every sixteen values, failing at the last step
+DATA = list(range(BATCH))
+
+
+def step(x):
+    return Some(x + 1)
+
+
+def last(x):
+    return Nothing() if x % 16 == 0 else Some(x)
+
+
+def checked_step(x):
+    return Ok(x + 1)
+
+
+def checked_last(x):
+    return Err(x) if x % 16 == 0 else Ok(x)
+
+
+@case("early return", "baseline: nested and_then lambdas", baseline=True)
+def _():
+    return [
+        step(x).and_then(
+            lambda a: step(a).and_then(
+                lambda b: step(b).and_then(lambda c: last(c).map(lambda d: d * 2))
+            )
+        )
+        for x in DATA
+    ]
+
+
+@result_block
+def chain_options(x):
+    a = step(x).q()
+    b = step(a).q()
+    c = step(b).q()
+    return Some(last(c).q() * 2)
+
+
+@case("early return", "Option.q in result_block")
+def _():
+    return [chain_options(x) for x in DATA]
+
+
+def chain_results_manually(x):
+    a = checked_step(x)
+    if a.is_err():
+        return a
+    b = checked_step(a.value)
+    if b.is_err():
+        return b
+    c = checked_step(b.value)
+    if c.is_err():
+        return c
+    d = checked_last(c.value)
+    if d.is_err():
+        return d
+    return Ok(d.value * 2)
+
+
+@case("early return", "baseline: if r.is_err(): return r", baseline=True)
+def _():
+    return [chain_results_manually(x) for x in DATA]
+
+
+@result_block
+def chain_results(x):
+    a = checked_step(x).q()
+    b = checked_step(a).q()
+    c = checked_step(b).q()
+    return Ok(checked_last(c).q() * 2)
+
+
+@case("early return", "Result.q in result_block")
+def _():
+    return [chain_results(x) for x in DATA]
@@ -0,0 +1,183 @@
+from benchmarks.harness import BATCH, case
+from src.pyrust_alerycserrania import Err, Ok, as_option
+
+DEPTHS = (1, 4, 16)
+
+# one miss every four values, like a moderately selective lookup
+VALUES = [None if i % 4 == 0 else i for i in range(BATCH)]
+OPTIONS = [as_option(x) for x in VALUES]
+RESULTS = [Err(i) if i % 4 == 0 else Ok(i) for i in range(BATCH)]
+FAILED = object()
+RAW_RESULTS = [FAILED if i % 4 == 0 else i for i in range(BATCH)]
+DATA = list(range(BATCH))
+
+
+def inc(x):
+    return x + 1
+
+
+def some_inc(x):
+    return as_option(x + 1)
+
+
+def ok_inc(x):
+    return Ok(x + 1)
+
+
+def positive(x):
+    return x > 0
+
+
+def zero():
+    return as_option(0)
+
+
+def register(depth):
+    steps = range(depth)
+
+    @case("combinators", f"baseline: None check x{depth}", baseline=True)
+    def _():
+        out = []
+        for x in VALUES:
+            for _ in steps:
+                x = None if x is None else inc(x)
+            out.append(x)
+        return out
+
+    @case("combinators", f"Option.map x{depth}")
+    def _():
+        out = []
+        for o in OPTIONS:
+            for _ in steps:
+                o = o.map(inc)
+            out.append(o)
+        return out
+
+    @case("combinators", f"Option.and_then x{depth}")
+    def _():
+        out = []
+        for o in OPTIONS:
+            for _ in steps:
+                o = o.and_then(some_inc)
+            out.append(o)
+        return out
+
+    @case("combinators", f"baseline: filter x{depth}", baseline=True)
+    def _():
+        out = []
+        for x in VALUES:
+            for _ in steps:
+                x = x if x is not None and positive(x) else None
+            out.append(x)
+        return out
+
+    @case("combinators", f"Option.filter x{depth}")
+    def _():
+        out = []
+        for o in OPTIONS:
+            for _ in steps:
+                o = o.filter(positive)
+            out.append(o)
+        return out
+
+    @case("combinators", f"baseline: or x{depth}", baseline=True)
+    def _():
+        out = []
+        for x in VALUES:
+            for _ in steps:
+                x = x if x is not None else 0
+            out.append(x)
+        return out
+
+    @case("combinators", f"Option.or_else x{depth}")
+    def _():
+        out = []
+        for o in OPTIONS:
+            for _ in steps:
+                o = o.or_else(zero)
+            out.append(o)
+        return out
+
+    @case("combinators", f"baseline: sentinel check x{depth}", baseline=True)
+    def _():
+        out = []
+        for x in RAW_RESULTS:
+            for _ in steps:
+                x = x if x is FAILED else inc(x)
+            out.append(x)
+        return out
+
+    @case("combinators", f"Result.map x{depth}")
+    def _():
+        out = []
+        for r in RESULTS:
+            for _ in steps:
+                r = r.map(inc)
+            out.append(r)
+        return out
+
+    @case("combinators", f"baseline: ok().and_then().ok_or() x{depth}", baseline=True)
+    def _():
+        out = []
+        for r in RESULTS:
+            for _ in steps:
+                r = r.ok().and_then(some_inc).ok_or(-1)
+            out.append(r)
+        return out
+
+    @case("combinators", f"Result.and_then x{depth}")
+    def _():
+        out = []
+        for r in RESULTS:
+            for _ in steps:
+                r = r.and_then(ok_inc)
+            out.append(r)
+        return out
+
+    @case("immutability", f"Ok(x).map x{depth}")
+    def _():
+        out = []
+        for x in DATA:
+            r = Ok(x)
+            for _ in steps:
+                r = r.map(inc)
+            out.append(r)
+        return out
+
+    @case("immutability", f"Ok(x).map_in_place x{depth}")
+    def _():
+        out = []
+        for x in DATA:
+            r = Ok(x)
+            for _ in steps:
+                r = r.map_in_place(inc)
+            out.append(r)
+        return out
+
+
+for depth in DEPTHS:
+    register(depth)
+
+
+@case("combinators", "baseline: ok().unwrap_or()", baseline=True)
+def _():
+    return [r.ok().unwrap_or(0) for r in RESULTS]
+
+
+@case("combinators", "Result.unwrap_or")
+def _():
+    return [r.unwrap_or(0) for r in RESULTS]
+
+
+REQUEST_IDS = [f"req-{i}" for i in range(BATCH)]
+OKS = [Ok(i) for i in range(BATCH)]
+
+
+@case("expect", "baseline: expect(f-string)", baseline=True)
+def _():
+    return [r.expect(f"request {rid} failed") for r, rid in zip(OKS, REQUEST_IDS)]
+
+
+@case("expect", "expect(format, arg)")
+def _():
+    return [r.expect("request %s failed", rid) for r, rid in zip(OKS, REQUEST_IDS)]
@@ -0,0 +1,51 @@
+import random
+
+from benchmarks.harness import BATCH, case
+from src.pyrust_alerycserrania import Err, Nothing, Ok, Some
+
+rng = random.Random(0)
+NUMBERS = [rng.randrange(BATCH) for _ in range(BATCH)]
+VALUES = [None if x % 4 == 0 else x for x in NUMBERS]
+OPTIONS = [Nothing() if x is None else Some(x) for x in VALUES]
+RESULTS = [Err(x) if x % 4 == 0 else Ok(x) for x in NUMBERS]
+PAIRS = list(zip(OPTIONS, reversed(OPTIONS)))
+RAW_PAIRS = list(zip(VALUES, reversed(VALUES)))
+
+
+def none_first(x):
+    return (x is not None, x or 0)
+
+
+@case("compare", "baseline: sorted(ints)", baseline=True)
+def _():
+    return sorted(NUMBERS)
+
+
+@case("compare", "baseline: sorted(None-aware key)", baseline=True)
+def _():
+    return sorted(VALUES, key=none_first)
+
+
+@case("compare", "sorted(options)")
+def _():
+    return sorted(OPTIONS)
+
+
+@case("compare", "sorted(results)")
+def _():
+    return sorted(RESULTS)
+
+
+@case("compare", "baseline: x == y", baseline=True)
+def _():
+    return [x == y for x, y in RAW_PAIRS]
+
+
+@case("compare", "Option == Option")
+def _():
+    return [x == y for x, y in PAIRS]
+
+
+@case("compare", "Option in set")
+def _():
+    return set(OPTIONS)
@@ -0,0 +1,29 @@
+from benchmarks.harness import BATCH, case
+from src.pyrust_alerycserrania import Err, Nothing, Ok, Some
+
+DATA = list(range(BATCH))
+
+
+@case("construction", "baseline: (x,)", baseline=True)
+def _():
+    return [(x,) for x in DATA]
+
+
+@case("construction", "Some(x)")
+def _():
+    return [Some(x) for x in DATA]
+
+
+@case("construction", "Nothing()")
+def _():
+    return [Nothing() for _ in DATA]
+
+
+@case("construction", "Ok(x)")
+def _():
+    return [Ok(x) for x in DATA]
+
+
+@case("construction", "Err(x)")
+def _():
+    return [Err(x) for x in DATA]
@@ -0,0 +1,101 @@
+from benchmarks.harness import BATCH, case
+from src.pyrust_alerycserrania import Capture, as_option, as_result
+
+DATA = list(range(BATCH))
+
+
+def lookup(x):
+    return x if x >= 0 else None
+
+
+def parse(x):
+    if x < 0:
+        raise ValueError(x)
+    return x
+
+
+option_lookup = as_option(lookup)
+result_parse = as_result(parse)
+result_parse_value_error = as_result((ValueError,))(parse)
+
+
+@case("decorators", "baseline: lookup + None check", baseline=True)
+def _():
+    return [y for y in map(lookup, DATA) if y is not None]
+
+
+@case("decorators", "as_option success")
+def _():
+    return list(map(option_lookup, DATA))
+
+
+@case("decorators", "baseline: lookup miss", baseline=True)
+def _():
+    return [lookup(-x) is None for x in DATA]
+
+
+@case("decorators", "as_option miss")
+def _():
+    return [option_lookup(-x - 1) for x in DATA]
+
+
+@case("decorators", "baseline: try success", baseline=True)
+def _():
+    out = []
+    for x in DATA:
+        try:
+            out.append(parse(x))
+        except Exception as exc:
+            out.append(exc)
+    return out
+
+
+@case("decorators", "as_result success")
+def _():
+    return list(map(result_parse, DATA))
+
+
+@case("decorators", "as_result((ValueError,)) success")
+def _():
+    return list(map(result_parse_value_error, DATA))
+
+
+@case("decorators", "baseline: try failure", baseline=True)
+def _():
+    out = []
+    for x in DATA:
+        try:
+            out.append(parse(-x - 1))
+        except Exception as exc:
+            out.append(exc)
+    return out
+
+
+@case("decorators", "as_result failure")
+def _():
+    return [result_parse(-x - 1) for x in DATA]
+
+
+@case("decorators", "as_result((ValueError,)) failure")
+def _():
+    return [result_parse_value_error(-x - 1) for x in DATA]
+
+
+@case("decorators", "Capture success")
+def _():
+    out = []
+    for x in DATA:
+        with Capture(ValueError) as captured:
+            captured.set(parse(x))
+        out.append(captured.result)
+    return out
+
+
+@case("decorators", "Capture failure")
+def _():
+    out = []
+    for x in DATA:
+        with Capture(ValueError) as captured:
+            captured.set(parse(-x - 1))
+        out.append(captured.result)
+    return out
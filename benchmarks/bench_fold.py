@@ -0,0 +1,82 @@
+from benchmarks.harness import BATCH, case
+from src.pyrust_alerycserrania import Err, Handlers, Nothing, Ok, Some
+
+OPTIONS = [Nothing() if i % 4 == 0 else Some(i) for i in range(BATCH)]
+RESULTS = [Err(i) if i % 4 == 0 else Ok(i) for i in range(BATCH)]
+HANDLERS = Handlers(
+    on_nothing=lambda: -1,
+    on_some=lambda x: x + 1,
+    on_ok=lambda x: x + 1,
+    on_err=lambda e: -e,
+)
+
+
+def inc(x):
+    return x + 1
+
+
+def neg(x):
+    return -x
+
+
+def minus_one():
+    return -1
+
+
+@case("fold", "baseline: match Option", baseline=True)
+def _():
+    out = []
+    for o in OPTIONS:
+        match o:
+            case Some(value=x):
+                out.append(x + 1)
+            case _:
+                out.append(-1)
+    return out
+
+
+@case("fold", "baseline: is_some()/unwrap()", baseline=True)
+def _():
+    return [o.unwrap() + 1 if o.is_some() else -1 for o in OPTIONS]
+
+
+@case("fold", "Option.fold")
+def _():
+    return [o.fold(inc, minus_one) for o in OPTIONS]
+
+
+@case("fold", "Option.fold_with")
+def _():
+    return [o.fold_with(HANDLERS) for o in OPTIONS]
+
+
+@case("fold", "map(Handlers, options)")
+def _():
+    return list(map(HANDLERS, OPTIONS))
+
+
+@case("fold", "baseline: match Result", baseline=True)
+def _():
+    out = []
+    for r in RESULTS:
+        match r:
+            case Ok(value=x):
+                out.append(x + 1)
+            case Err(error=e):
+                out.append(-e)
+    return out
+
+
+@case("fold", "Result.fold")
+def _():
+    return [r.fold(inc, neg) for r in RESULTS]
+
+
+@case("fold", "Result.fold_with")
+def _():
+    return [r.fold_with(HANDLERS) for r in RESULTS]
+
+
+@case("fold", "map(Handlers, results)")
+def _():
+    return list(map(HANDLERS, RESULTS))
@@ -0,0 +1,65 @@
+from benchmarks.harness import BATCH, case
+from src.pyrust_alerycserrania import Err, Ok
+
+
+class MatchOk:
+    """Ok as it compared before type tags: structural ``match`` dispatch."""
+
+    __slots__ = ("value",)
+    __match_args__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        match other:
+            case MatchOk(value):
+                return self.value.__eq__(value)
+            case MatchErr(_):
+                return False
+            case _:
+                return super().__eq__(other)
+
+    def __hash__(self):
+        return hash((2, self.value))
+
+
+class MatchErr:
+    __slots__ = ("error",)
+    __match_args__ = ("error",)
+
+    def __init__(self, error):
+        self.error = error
+
+    def __eq__(self, other):
+        match other:
+            case MatchOk(_):
+                return False
+            case MatchErr(error):
+                return self.error.__eq__(error)
+            case _:
+                return super().__eq__(other)
+
+    def __hash__(self):
+        return hash((3, self.error))
+
+
+def register(label, ok, err, n=BATCH):
+    values = [ok(i) if i % 4 else err(i) for i in range(n)]
+    probes = [ok(i) if i % 4 else err(i) for i in range(0, n, 7)]
+    # every probe collides with its equal value, so each lookup runs __eq__
+    table = dict.fromkeys(values)
+    members = set(values)
+
+    case("hash", f"{label}: list.count", ops=n)(lambda: values.count(values[-1]))
+    case("hash", f"{label}: set build", ops=n)(lambda: set(values))
+    case("hash", f"{label}: dict lookup", ops=len(probes))(
+        lambda: [table[probe] for probe in probes]
+    )
+    case("hash", f"{label}: set membership", ops=len(probes))(
+        lambda: [probe in members for probe in probes]
+    )
+
+
+register("match", MatchOk, MatchErr)
+register("tagged", Ok, Err)
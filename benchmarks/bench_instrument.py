@@ -0,0 +1,50 @@
+from benchmarks.harness import BATCH, case
+from src.pyrust_alerycserrania import Err, as_result, instrument
+
+DATA = list(range(BATCH))
+
+
+def parse(x):
+    if x < 0:
+        raise ValueError(x)
+    return x
+
+
+plain = as_result(parse)
+disabled = instrument.instrumented(as_result(parse))
+instrument.enable()
+enabled = instrument.instrumented(as_result(parse))
+instrument.disable()
+
+
+def ignore(_):
+    pass
+
+
+@case("instrument", "as_result success")
+def _():
+    return list(map(plain, DATA))
+
+
+@case("instrument", "instrumented (disabled) success")
+def _():
+    return list(map(disabled, DATA))
+
+
+@case("instrument", "instrumented (enabled) success")
+def _():
+    return list(map(enabled, DATA))
+
+
+@case("instrument", "Err() without hooks")
+def _():
+    return list(map(Err, DATA))
+
+
+@case("instrument", "Err() with one hook")
+def _():
+    instrument.add_err_hook(ignore)
+    try:
+        return list(map(Err, DATA))
+    finally:
+        instrument.remove_err_hook(ignore)
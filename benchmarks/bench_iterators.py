@@ -0,0 +1,61 @@
+from benchmarks.harness import BATCH, case
+from src.pyrust_alerycserrania import Err, Nothing, Ok, Some
+from src.pyrust_alerycserrania.iterators import err_values, filter_map, flatten, ok_values, unwrap_or_default
+
+OPTIONS = [Nothing() if i % 4 == 0 else Some(i) for i in range(BATCH)]
+RESULTS = [Err(i) if i % 4 == 0 else Ok(i) for i in range(BATCH)]
+DATA = list(range(BATCH))
+
+
+def checked(x):
+    return Err(x) if x % 4 == 0 else Ok(x)
+
+
+@case("streams", "baseline: unwrap() if is_some()", baseline=True)
+def _():
+    return [o.unwrap() for o in OPTIONS if o.is_some()]
+
+
+@case("streams", "flatten(options)")
+def _():
+    return list(flatten(OPTIONS))
+
+
+@case("streams", "baseline: unwrap() if is_ok()", baseline=True)
+def _():
+    return [r.unwrap() for r in RESULTS if r.is_ok()]
+
+
+@case("streams", "ok_values(results)")
+def _():
+    return list(ok_values(RESULTS))
+
+
+@case("streams", "baseline: unwrap_err() if is_err()", baseline=True)
+def _():
+    return [r.unwrap_err() for r in RESULTS if r.is_err()]
+
+
+@case("streams", "err_values(results)")
+def _():
+    return list(err_values(RESULTS))
+
+
+@case("streams", "baseline: unwrap_or(0)", baseline=True)
+def _():
+    return [o.unwrap_or(0) for o in OPTIONS]
+
+
+@case("streams", "unwrap_or_default(options, 0)")
+def _():
+    return list(unwrap_or_default(OPTIONS, 0))
+
+
+@case("streams", "baseline: filter_map comprehension", baseline=True)
+def _():
+    return [r.unwrap() for r in map(checked, DATA) if r.is_ok()]
+
+
+@case("streams", "filter_map(fn, values)")
+def _():
+    return list(filter_map(checked, DATA))
@@ -0,0 +1,40 @@
+import sys
+import tracemalloc
+
+from src.pyrust_alerycserrania import Err, Nothing, Ok, Some
+
+N = 1_000_000
+
+
+def measure(factory, payloads):
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    objects = [factory(payload) for payload in payloads]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # the list itself costs one pointer per element whatever is stored in it
+    container = sys.getsizeof(objects)
+    del objects
+    return max(after - before - container, 0) / len(payloads)
+
+
+CASES = {
+    "None": lambda _: None,
+    "(value,)": lambda value: (value,),
+    "(True, value)": lambda value: (True, value),
+    "Some(value)": Some,
+    "Ok(value)": Ok,
+    "Err(value)": Err,
+    "Nothing()": lambda _: Nothing(),
+}
+
+
+def main(n: int = N):
+    payloads = list(range(n))
+    print(f"{'case':<16}{'bytes/object':>14}")
+    for name, factory in CASES.items():
+        print(f"{name:<16}{measure(factory, payloads):>14.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else N)
@@ -0,0 +1,49 @@
+from benchmarks.harness import BATCH, case
+from src.pyrust_alerycserrania import Nothing, Some
+from src.pyrust_alerycserrania.pipeline import OptionPipeline
+
+DATA = list(range(BATCH))
+
+
+def inc(x):
+    return x + 1
+
+
+def odd(x):
+    return x % 2 == 1
+
+
+def half(x):
+    return Some(x // 2) if x % 3 else Nothing()
+
+
+PIPELINE = OptionPipeline().map(inc).filter(odd).and_then(half).map_or(0, inc)
+RUN = PIPELINE.compile()
+
+
+@case("pipeline", "baseline: inline None checks", baseline=True)
+def _():
+    out = []
+    for x in DATA:
+        x = inc(x)
+        if odd(x):
+            y = half(x)
+            out.append(0 if y is Nothing() else inc(y.value))
+        else:
+            out.append(0)
+    return out
+
+
+@case("pipeline", "method chain")
+def _():
+    return [Some(x).map(inc).filter(odd).and_then(half).map_or(0, inc) for x in DATA]
+
+
+@case("pipeline", "OptionPipeline.over")
+def _():
+    return list(PIPELINE.over(DATA))
+
+
+@case("pipeline", "OptionPipeline.compile()")
+def _():
+    return [RUN(x) for x in DATA]
@@ -0,0 +1,44 @@
+import bisect
+import heapq
+import random
+import sys
+import timeit
+
+from src.pyrust_alerycserrania import Err, Nothing, Ok, Some, sort_key
+
+N = 1_000_000
+
+
+def main(n: int = N, repeat: int = 3):
+    rng = random.Random(0)
+    numbers = [rng.randrange(n) for _ in range(n)]
+    options = [Nothing() if x % 4 == 0 else Some(x) for x in numbers]
+    results = [Err(x) if x % 4 == 0 else Ok(x) for x in numbers]
+    keys = [(x % 4 != 0, x) for x in numbers]
+    ordered = sorted(options, key=sort_key)
+    ordered_keys = list(map(sort_key, ordered))
+    probes = options[:1000]
+
+    cases = {
+        "baseline: sorted(tuples)": lambda: sorted(keys),
+        "sorted(options)": lambda: sorted(options),
+        "sorted(options, key=sort_key)": lambda: sorted(options, key=sort_key),
+        "sorted(results)": lambda: sorted(results),
+        "sorted(results, key=sort_key)": lambda: sorted(results, key=sort_key),
+        "heapify(options)": lambda: heapq.heapify(options[:]),
+        "heapify((sort_key, option))": lambda: heapq.heapify(
+            [(sort_key(option), option) for option in options]
+        ),
+        "bisect x1000": lambda: [bisect.bisect(ordered, probe) for probe in probes],
+        "bisect x1000, precomputed keys": lambda: [
+            bisect.bisect(ordered_keys, sort_key(probe)) for probe in probes
+        ],
+    }
+    print(f"{'case (n=' + str(n) + ')':<34}{'best (ms)':>12}")
+    for name, func in cases.items():
+        best = min(timeit.repeat(func, number=1, repeat=repeat))
+        print(f"{name:<34}{best * 1e3:>12.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else N)
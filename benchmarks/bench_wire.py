@@ -0,0 +1,29 @@
+import pickle
+
+from benchmarks.harness import BATCH, case
+from src.pyrust_alerycserrania import Err, Ok
+from src.pyrust_alerycserrania.wire import decode, encode
+
+RESULTS = [Err(str(i)) if i % 4 == 0 else Ok(i) for i in range(BATCH)]
+PICKLED = pickle.dumps(RESULTS, pickle.HIGHEST_PROTOCOL)
+ENCODED = encode(RESULTS)
+
+
+@case("wire", "pickle.dumps(list)")
+def _():
+    return pickle.dumps(RESULTS, pickle.HIGHEST_PROTOCOL)
+
+
+@case("wire", "encode")
+def _():
+    return encode(RESULTS)
+
+
+@case("wire", "pickle.loads(list)")
+def _():
+    return pickle.loads(PICKLED)
+
+
+@case("wire", "decode")
+def _():
+    return decode(ENCODED)
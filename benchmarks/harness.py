@@ -0,0 +1,34 @@
+import timeit
+from dataclasses import dataclass
+from typing import Callable, List
+
+BATCH = 10_000
+
+
+@dataclass
+class Case:
+    group: str
+    name: str
+    func: Callable[[], object]
+    ops: int
+    baseline: bool
+
+    def measure(self, repeat: int) -> float:
+        """Best time of ``repeat`` runs, in nanoseconds per operation."""
+        timer = timeit.Timer(self.func)
+        number, _ = timer.autorange()
+        best = min(timer.repeat(repeat=repeat, number=number))
+        return best / number / self.ops * 1e9
+
+
+CASES: List[Case] = []
+
+
+def case(group: str, name: str, ops: int = BATCH, baseline: bool = False):
+    """Register a zero-argument callable performing ``ops`` operations."""
+
+    def decorator(func):
+        CASES.append(Case(group, name, func, ops, baseline))
+        return func
+
+    return decorator
@@ -1,14 +1,51 @@
 import collections
 import functools
+import inspect
+import operator
 from abc import abstractmethod
-from typing import Any, Callable, Generic, Iterable, List, Tuple, Type, TypeVar, overload
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    NoReturn,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
 
 T = TypeVar("T")
 U = TypeVar("U")
 E = TypeVar("E")
 
+# Variant tags, ordered so that Nothing < Some and Ok < Err. Comparisons read
+# the tag off the other operand instead of pattern matching on its class.
+_NOTHING_TAG = 0
+_SOME_TAG = 1
+_OK_TAG = 2
+_ERR_TAG = 3
+
+# Called with every Err created and every Panic raised. Managed by the
+# instrument module; empty unless hooks were registered.
+_err_hooks: List[Callable[[Any], None]] = []
+_panic_hooks: List[Callable[[Any], None]] = []
+
+
+def _immutable(self, *_):
+    raise AttributeError(f"{type(self).__name__} objects are immutable")
+
 
 class Result(Generic[T, E]):
+    __slots__ = ()
+
     @abstractmethod
     def is_ok(self) -> bool:
         ...
@@ -49,6 +86,58 @@ class Result(Generic[T, E]):
     def map_err(self, fn: Callable[[E], U]) -> "Result[T, U]":
         ...
 
+    @abstractmethod
+    def and_(self, other: "Result[U, E]") -> "Result[U, E]":
+        ...
+
+    @abstractmethod
+    def and_then(self, fn: Callable[[T], "Result[U, E]"]) -> "Result[U, E]":
+        ...
+
+    @abstractmethod
+    def or_(self, other: "Result[T, U]") -> "Result[T, U]":
+        ...
+
+    @abstractmethod
+    def or_else(self, fn: Callable[[E], "Result[T, U]"]) -> "Result[T, U]":
+        ...
+
+    @abstractmethod
+    def unwrap_or(self, default: T) -> T:
+        ...
+
+    @abstractmethod
+    def unwrap_or_else(self, fn: Callable[[E], T]) -> T:
+        ...
+
+    @abstractmethod
+    def flatten(self) -> "Result[Any, E]":
+        ...
+
+    @abstractmethod
+    def iter(self) -> Iterator[T]:
+        ...
+
+    @abstractmethod
+    def map_in_place(self, fn: Callable[[T], U]) -> "Result[U, E]":
+        ...
+
+    @abstractmethod
+    def map_err_in_place(self, fn: Callable[[E], U]) -> "Result[T, U]":
+        ...
+
+    @abstractmethod
+    def sort_key(self) -> Tuple[int, Any]:
+        ...
+
+    @abstractmethod
+    def fold(self, on_ok: Callable[[T], U], on_err: Callable[[E], U]) -> U:
+        ...
+
+    @abstractmethod
+    def fold_with(self, handlers: "Handlers") -> Any:
+        ...
+
     @abstractmethod
     def inspect(self, fn: Callable[[T], None]) -> "Result[T, E]":
         ...
@@ -58,7 +147,7 @@ class Result(Generic[T, E]):
         ...
 
     @abstractmethod
-    def expect(self, msg: str) -> T:
+    def expect(self, msg: "Message", *args: Any) -> T:
         ...
 
     @abstractmethod
@@ -66,19 +155,51 @@ class Result(Generic[T, E]):
         ...
 
     @abstractmethod
-    def expect_err(self, msg: str) -> E:
+    def q(self) -> T:
+        ...
+
+    @abstractmethod
+    def expect_err(self, msg: "Message", *args: Any) -> E:
         ...
 
     @abstractmethod
     def unwrap_err(self) -> E:
         ...
 
+    @abstractmethod
+    def transpose(self) -> "Option[Result[Any, E]]":
+        ...
+
+    @abstractmethod
+    async def map_async(self, fn: Callable[[T], Awaitable[U]]) -> "Result[U, E]":
+        ...
+
+    @abstractmethod
+    async def and_then_async(
+        self, fn: Callable[[T], Awaitable["Result[U, E]"]]
+    ) -> "Result[U, E]":
+        ...
+
+    @abstractmethod
+    async def or_else_async(
+        self, fn: Callable[[E], Awaitable["Result[T, U]"]]
+    ) -> "Result[T, U]":
+        ...
+
 
 class Ok(Result[T, E]):
+    __slots__ = ("value",)
     __match_args__ = ("value",)
+    _tag = _OK_TAG
+
+    __setattr__ = _immutable
+    __delattr__ = _immutable
 
     def __init__(self, value: T):
-        self.value = value
+        object.__setattr__(self, "value", value)
+
+    def __reduce__(self):
+        return (Ok, (self.value,))
 
     def is_ok(self):
         return True
@@ -96,11 +217,10 @@ class Ok(Result[T, E]):
         return Some(self.value)
 
     def err(self):
-        return Nothing()
+        return _NOTHING
 
     def map(self, fn: Callable[[T], U]):
-        self.value = fn(self.value)
-        return self
+        return Ok(fn(self.value))
 
     def map_or(self, _, fn: Callable[[T], U]):
         return fn(self.value)
@@ -111,6 +231,38 @@ class Ok(Result[T, E]):
     def map_err(self, _):
         return self
 
+    def and_(self, other: "Result[U, E]"):
+        return other
+
+    def and_then(self, fn: Callable[[T], "Result[U, E]"]):
+        return fn(self.value)
+
+    def or_(self, _):
+        return self
+
+    def or_else(self, _):
+        return self
+
+    def unwrap_or(self, _):
+        return self.value
+
+    def unwrap_or_else(self, _):
+        return self.value
+
+    def flatten(self):
+        if getattr(self.value, "_tag", None) not in (_OK_TAG, _ERR_TAG):
+            raise TypeError(
+                f"cannot flatten Ok({self.value!r}), its value is not a Result"
+            )
+        return self.value
+
+    def map_in_place(self, fn: Callable[[T], U]):
+        object.__setattr__(self, "value", fn(self.value))
+        return self
+
+    def map_err_in_place(self, _):
+        return self
+
     def inspect(self, fn: Callable[[T], None]):
         fn(self.value)
         return self
@@ -118,54 +270,120 @@ class Ok(Result[T, E]):
     def inspect_err(self, _):
         return self
 
-    def expect(self, _):
+    def expect(self, msg: "Message", *args: Any):
         return self.value
 
     def unwrap(self):
         return self.value
 
-    def expect_err(self, msg: str):
-        raise Panic(msg)
+    def q(self):
+        return self.value
+
+    def expect_err(self, msg: "Message", *args: Any):
+        _panic(self, self.value, msg, args)
 
     def unwrap_err(self):
-        raise Panic()
+        _panic(self, self.value)
+
+    def transpose(self):
+        if self.value._tag == _NOTHING_TAG:
+            return _NOTHING
+        return Some(Ok(self.value.value))
+
+    async def map_async(self, fn: Callable[[T], Awaitable[U]]):
+        return Ok(await fn(self.value))
+
+    async def and_then_async(self, fn: Callable[[T], Awaitable["Result[U, E]"]]):
+        return await fn(self.value)
+
+    async def or_else_async(self, _):
+        return self
 
     def __repr__(self) -> str:
         return f"Ok({repr(self.value)})"
 
     def __lt__(self, other):
-        match other:
-            case Ok(value):
-                return self.value.__lt__(value)
-            case Err(_):
-                return True
-            case _:
-                return super().__lt__(other)
+        tag = getattr(other, "_tag", None)
+        if tag == _OK_TAG:
+            return self.value < other.value
+        if tag == _ERR_TAG:
+            return True
+        return NotImplemented
 
     def __le__(self, other):
-        match other:
-            case Ok(value):
-                return self.value.__le__(value)
-            case Err(_):
-                return True
-            case _:
-                return super().__le__(other)
+        tag = getattr(other, "_tag", None)
+        if tag == _OK_TAG:
+            return self.value <= other.value
+        if tag == _ERR_TAG:
+            return True
+        return NotImplemented
+
+    def __gt__(self, other):
+        tag = getattr(other, "_tag", None)
+        if tag == _OK_TAG:
+            return self.value > other.value
+        if tag == _ERR_TAG:
+            return False
+        return NotImplemented
+
+    def __ge__(self, other):
+        tag = getattr(other, "_tag", None)
+        if tag == _OK_TAG:
+            return self.value >= other.value
+        if tag == _ERR_TAG:
+            return False
+        return NotImplemented
 
     def __eq__(self, other):
-        match other:
-            case Ok(value):
-                return self.value.__eq__(value)
-            case Err(_):
-                return False
-            case _:
-                return super().__eq__(other)
+        tag = getattr(other, "_tag", None)
+        if tag == _OK_TAG:
+            return self.value == other.value
+        if tag is None:
+            return NotImplemented
+        return False
+
+    def __ne__(self, other):
+        tag = getattr(other, "_tag", None)
+        if tag == _OK_TAG:
+            return self.value != other.value
+        if tag is None:
+            return NotImplemented
+        return True
+
+    def __hash__(self):
+        return hash((_OK_TAG, self.value))
+
+    def sort_key(self):
+        return (_OK_TAG, self.value)
+
+    def fold(self, on_ok: Callable[[T], U], _):
+        return on_ok(self.value)
+
+    def fold_with(self, handlers: "Handlers"):
+        return handlers[_OK_TAG](self.value)
+
+    def __iter__(self):
+        return iter((self.value,))
+
+    iter = __iter__
 
 
 class Err(Result[T, E]):
+    __slots__ = ("error",)
     __match_args__ = ("error",)
+    _tag = _ERR_TAG
+
+    __setattr__ = _immutable
+    __delattr__ = _immutable
 
     def __init__(self, error: E):
-        self.error = error
+        object.__setattr__(self, "error", error)
+        if _err_hooks:
+            for hook in _err_hooks:
+                hook(self)
+
+    def __reduce__(self):
+        return (Err, (self.error,))
 
     def is_ok(self):
         return False
@@ -180,7 +398,7 @@ class Err(Result[T, E]):
         return fn(self.error)
 
     def ok(self):
-        return Nothing()
+        return _NOTHING
 
     def err(self):
         return Some(self.error)
@@ -195,63 +413,145 @@ class Err(Result[T, E]):
         return default()
 
     def map_err(self, fn: Callable[[E], U]):
-        self.error = fn(self.error)
+        return Err(fn(self.error))
+
+    def and_(self, _):
+        return self
+
+    def and_then(self, _):
+        return self
+
+    def or_(self, other: "Result[T, U]"):
+        return other
+
+    def or_else(self, fn: Callable[[E], "Result[T, U]"]):
+        return fn(self.error)
+
+    def unwrap_or(self, default: T):
+        return default
+
+    def unwrap_or_else(self, fn: Callable[[E], T]):
+        return fn(self.error)
+
+    def flatten(self):
+        return self
+
+    def map_in_place(self, _):
+        return self
+
+    def map_err_in_place(self, fn: Callable[[E], U]):
+        object.__setattr__(self, "error", fn(self.error))
         return self
 
     def inspect(self, _):
         return self
 
     def inspect_err(self, fn: Callable[[E], None]):
-        fn(self.value)
+        fn(self.error)
         return self
 
-    def expect(self, msg: str):
-        raise Panic(msg)
+    def expect(self, msg: "Message", *args: Any):
+        _panic(self, self.error, msg, args)
 
     def unwrap(self):
-        raise Panic()
+        _panic(self, self.error)
+
+    def q(self):
+        raise _EarlyReturn(self)
 
-    def expect_err(self, _):
+    def expect_err(self, msg: "Message", *args: Any):
         return self.error
 
     def unwrap_err(self):
         return self.error
 
+    def transpose(self):
+        return Some(self)
+
+    async def map_async(self, _):
+        return self
+
+    async def and_then_async(self, _):
+        return self
+
+    async def or_else_async(self, fn: Callable[[E], Awaitable["Result[T, U]"]]):
+        return await fn(self.error)
+
     def __repr__(self) -> str:
         return f"Err({repr(self.error)})"
 
     def __lt__(self, other):
-        match other:
-            case Ok(_):
-                return False
-            case Err(error):
-                return self.error.__lt__(error)
-            case _:
-                return super().__lt__(other)
+        tag = getattr(other, "_tag", None)
+        if tag == _ERR_TAG:
+            return self.error < other.error
+        if tag == _OK_TAG:
+            return False
+        return NotImplemented
 
     def __le__(self, other):
-        match other:
-            case Ok(_):
-                return False
-            case Err(error):
-                return self.error.__le__(error)
-            case _:
-                return super().__le__(other)
+        tag = getattr(other, "_tag", None)
+        if tag == _ERR_TAG:
+            return self.error <= other.error
+        if tag == _OK_TAG:
+            return False
+        return NotImplemented
+
+    def __gt__(self, other):
+        tag = getattr(other, "_tag", None)
+        if tag == _ERR_TAG:
+            return self.error > other.error
+        if tag == _OK_TAG:
+            return True
+        return NotImplemented
+
+    def __ge__(self, other):
+        tag = getattr(other, "_tag", None)
+        if tag == _ERR_TAG:
+            return self.error >= other.error
+        if tag == _OK_TAG:
+            return True
+        return NotImplemented
 
     def __eq__(self, other):
-        match other:
-            case Ok(_):
-                return False
-            case Err(error):
-                return self.error.__eq__(error)
-            case _:
-                return super().__eq__(other)
+        tag = getattr(other, "_tag", None)
+        if tag == _ERR_TAG:
+            return self.error == other.error
+        if tag is None:
+            return NotImplemented
+        return False
+
+    def __ne__(self, other):
+        tag = getattr(other, "_tag", None)
+        if tag == _ERR_TAG:
+            return self.error != other.error
+        if tag is None:
+            return NotImplemented
+        return True
+
+    def __hash__(self):
+        return hash((_ERR_TAG, self.error))
+
+    def sort_key(self):
+        return (_ERR_TAG, self.error)
+
+    def fold(self, _, on_err: Callable[[E], U]):
+        return on_err(self.error)
+
+    def fold_with(self, handlers: "Handlers"):
+        return handlers[_ERR_TAG](self.error)
 
     def __bool__(self):
-        return bool(self.value)
+        return bool(self.error)
+
+    def __iter__(self):
+        return iter(())
+
+    iter = __iter__
 
 
 class Option(Generic[T]):
+    __slots__ = ()
+
     @abstractmethod
     def is_some(self) -> bool:
         ...
@@ -265,13 +565,17 @@ class Option(Generic[T]):
         ...
 
     @abstractmethod
-    def expect(self, msg: str) -> T:
+    def expect(self, msg: "Message", *args: Any) -> T:
         ...
 
     @abstractmethod
     def unwrap(self) -> T:
         ...
 
+    @abstractmethod
+    def q(self) -> T:
+        ...
+
     @abstractmethod
     def unwrap_or(self, default: T) -> T:
         ...
@@ -288,6 +592,22 @@ class Option(Generic[T]):
     def map(self, fn: Callable[[T], U]) -> "Option[U]":
         ...
 
+    @abstractmethod
+    def map_in_place(self, fn: Callable[[T], U]) -> "Option[U]":
+        ...
+
+    @abstractmethod
+    def sort_key(self) -> Tuple[Any, ...]:
+        ...
+
+    @abstractmethod
+    def fold(self, on_some: Callable[[T], U], on_nothing: Callable[[], U]) -> U:
+        ...
+
+    @abstractmethod
+    def fold_with(self, handlers: "Handlers") -> Any:
+        ...
+
     @abstractmethod
     def map_or(self, default: U, fn: Callable[[T], U]) -> U:
         ...
@@ -328,12 +648,24 @@ class Option(Generic[T]):
     def ok_or_else(self, err: Callable[[], E]) -> "Result[T, E]":
         ...
 
+    @abstractmethod
+    def transpose(self) -> "Result[Option[Any], Any]":
+        ...
+
 
 class Some(Option[T]):
+    __slots__ = ("value",)
     __match_args__ = ("value",)
+    _tag = _SOME_TAG
+
+    __setattr__ = _immutable
+    __delattr__ = _immutable
 
     def __init__(self, value: T):
-        self.value = value
+        object.__setattr__(self, "value", value)
+
+    def __reduce__(self):
+        return (Some, (self.value,))
 
     def is_some(self):
         return True
@@ -344,12 +676,15 @@ class Some(Option[T]):
     def is_nothing(self):
         return False
 
-    def expect(self, _):
+    def expect(self, msg: "Message", *args: Any):
         return self.value
 
     def unwrap(self):
         return self.value
 
+    def q(self):
+        return self.value
+
     def unwrap_or(self, _):
         return self.value
 
@@ -363,6 +698,10 @@ class Some(Option[T]):
     def map(self, fn: Callable[[T], U]):
         return Some(fn(self.value))
 
+    def map_in_place(self, fn: Callable[[T], U]):
+        object.__setattr__(self, "value", fn(self.value))
+        return self
+
     def map_or(self, _, fn: Callable[[T], U]):
         return fn(self.value)
 
@@ -376,7 +715,7 @@ class Some(Option[T]):
         return fn(self.value)
 
     def filter(self, predicate: Callable[[T], bool]):
-        return self if predicate(self.value) else Nothing()
+        return self if predicate(self.value) else _NOTHING
 
     def or_(self, _):
         return self
@@ -385,7 +724,7 @@ class Some(Option[T]):
         return self
 
     def xor(self, other: "Option[T]"):
-        return Nothing() if other.is_some() else self
+        return self if other._tag == _NOTHING_TAG else _NOTHING
 
     def ok_or(self, _):
         return Ok(self.value)
@@ -393,44 +732,97 @@ class Some(Option[T]):
     def ok_or_else(self, _):
         return Ok(self.value)
 
+    def transpose(self):
+        if self.value._tag == _ERR_TAG:
+            return self.value
+        return Ok(Some(self.value.value))
+
     def __repr__(self) -> str:
         return f"Some({repr(self.value)})"
 
     def __lt__(self, other):
-        match other:
-            case Some(value):
-                return self.value.__lt__(value)
-            case Nothing():
-                return False
-            case _:
-                return super().__lt__(other)
+        tag = getattr(other, "_tag", None)
+        if tag == _SOME_TAG:
+            return self.value < other.value
+        if tag == _NOTHING_TAG:
+            return False
+        return NotImplemented
 
     def __le__(self, other):
-        match other:
-            case Some(value):
-                return self.value.__le__(value)
-            case Nothing():
-                return False
-            case _:
-                return super().__le__(other)
+        tag = getattr(other, "_tag", None)
+        if tag == _SOME_TAG:
+            return self.value <= other.value
+        if tag == _NOTHING_TAG:
+            return False
+        return NotImplemented
+
+    def __gt__(self, other):
+        tag = getattr(other, "_tag", None)
+        if tag == _SOME_TAG:
+            return self.value > other.value
+        if tag == _NOTHING_TAG:
+            return True
+        return NotImplemented
+
+    def __ge__(self, other):
+        tag = getattr(other, "_tag", None)
+        if tag == _SOME_TAG:
+            return self.value >= other.value
+        if tag == _NOTHING_TAG:
+            return True
+        return NotImplemented
 
     def __eq__(self, other):
-        match other:
-            case Some(value):
-                return self.value.__eq__(value)
-            case Nothing():
-                return False
-            case _:
-                return super().__eq__(other)
+        tag = getattr(other, "_tag", None)
+        if tag == _SOME_TAG:
+            return self.value == other.value
+        if tag is None:
+            return NotImplemented
+        return False
+
+    def __ne__(self, other):
+        tag = getattr(other, "_tag", None)
+        if tag == _SOME_TAG:
+            return self.value != other.value
+        if tag is None:
+            return NotImplemented
+        return True
+
+    def __hash__(self):
+        return hash((_SOME_TAG, self.value))
+
+    def sort_key(self):
+        return (_SOME_TAG, self.value)
+
+    def fold(self, on_some: Callable[[T], U], _):
+        return on_some(self.value)
+
+    def fold_with(self, handlers: "Handlers"):
+        return handlers[_SOME_TAG](self.value)
 
     def __bool__(self):
         return bool(self.value)
 
     def __iter__(self):
-        yield self.value
+        return iter((self.value,))
 
 
 class Nothing(Option):
+    __slots__ = ()
+    _tag = _NOTHING_TAG
+
+    def __new__(cls):
+        return _NOTHING
+
+    def __reduce__(self):
+        return (Nothing, ())
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, _):
+        return self
+
     def is_some(self):
         return False
 
@@ -440,11 +832,14 @@ class Nothing(Option):
     def is_nothing(self):
         return True
 
-    def expect(self, msg: str):
-        raise Panic(msg)
+    def expect(self, msg: "Message", *args: Any):
+        _panic(self, None, msg, args)
 
     def unwrap(self):
-        raise Panic()
+        _panic(self, None)
+
+    def q(self):
+        raise _NOTHING_RETURN
 
     def unwrap_or(self, default: T):
         return default
@@ -458,6 +853,9 @@ class Nothing(Option):
     def map(self, _):
         return self
 
+    def map_in_place(self, _):
+        return self
+
     def map_or(self, default: U, _):
         return default
 
@@ -488,46 +886,195 @@ class Nothing(Option):
     def ok_or_else(self, err: Callable[[], E]):
         return Err(err())
 
+    def transpose(self):
+        return Ok(self)
+
     def __repr__(self) -> str:
         return "Nothing"
 
     def __lt__(self, other):
-        match other:
-            case Some(_):
-                return True
-            case Nothing():
-                return False
-            case _:
-                return super().__lt__(other)
+        if other is self:
+            return False
+        tag = getattr(other, "_tag", None)
+        if tag == _SOME_TAG:
+            return True
+        if tag == _NOTHING_TAG:
+            return False
+        return NotImplemented
 
     def __le__(self, other):
-        match other:
-            case Some(_):
-                return True
-            case Nothing():
-                return True
-            case _:
-                return super().__le__(other)
+        if other is self:
+            return True
+        tag = getattr(other, "_tag", None)
+        if tag == _SOME_TAG:
+            return True
+        if tag == _NOTHING_TAG:
+            return True
+        return NotImplemented
+
+    def __gt__(self, other):
+        if other is self:
+            return False
+        tag = getattr(other, "_tag", None)
+        if tag == _SOME_TAG:
+            return False
+        if tag == _NOTHING_TAG:
+            return False
+        return NotImplemented
+
+    def __ge__(self, other):
+        if other is self:
+            return True
+        tag = getattr(other, "_tag", None)
+        if tag == _SOME_TAG:
+            return False
+        if tag == _NOTHING_TAG:
+            return True
+        return NotImplemented
 
     def __eq__(self, other):
-        match other:
-            case Some(_):
-                return False
-            case Nothing():
-                return True
-            case _:
-                return super().__eq__(other)
+        if other is self:
+            return True
+        tag = getattr(other, "_tag", None)
+        if tag is None:
+            return NotImplemented
+        return tag == _NOTHING_TAG
+
+    def __ne__(self, other):
+        if other is self:
+            return False
+        tag = getattr(other, "_tag", None)
+        if tag is None:
+            return NotImplemented
+        return tag != _NOTHING_TAG
+
+    def __hash__(self):
+        return hash(_NOTHING_TAG)
+
+    def sort_key(self):
+        return _NOTHING_KEY
+
+    def fold(self, _, on_nothing: Callable[[], U]):
+        return on_nothing()
+
+    def fold_with(self, handlers: "Handlers"):
+        return handlers[_NOTHING_TAG]()
 
     def __bool__(self):
         return bool(None)
 
     def __iter__(self):
-        return
+        return iter(())
+
+
+_NOTHING = object.__new__(Nothing)
+_NOTHING_KEY = (_NOTHING_TAG,)
+
+# Key function ordering Options and Results the way their comparison
+# operators do, as plain tuples: sorted(items, key=sort_key) then compares
+# in C. Nothing sorts before Some, Ok before Err.
+sort_key = operator.methodcaller("sort_key")
+
+
+class Handlers(NamedTuple):
+    """Handlers for each variant, built once and reused with ``fold_with``.
+
+    The fields are ordered by variant tag, so ``fold_with`` picks its handler
+    with a constant tuple index. A ``Handlers`` is itself callable::
+
+        describe = Handlers(on_ok=str, on_err=lambda e: f"error: {e}")
+        lines = list(map(describe, results))
+    """
+
+    on_nothing: Optional[Callable[[], Any]] = None
+    on_some: Optional[Callable[[Any], Any]] = None
+    on_ok: Optional[Callable[[Any], Any]] = None
+    on_err: Optional[Callable[[Any], Any]] = None
+
+    def __call__(self, item: Any) -> Any:
+        return item.fold_with(self)
+
+
+class _EarlyReturn(BaseException):
+    """Raised by ``q`` on an ``Err``/``Nothing`` to return it from the
+    enclosing ``result_block`` function."""
+
+    def __init__(self, item: Any):
+        self.item = item
+
+
+# Nothing carries no payload, so a single signal serves every Nothing.q()
+_NOTHING_RETURN = _EarlyReturn(_NOTHING)
+
+
+def result_block(func: Callable) -> Callable:
+    """Let ``func`` use ``q``, the counterpart of Rust's ``?`` operator.
+
+    Inside ``func``, ``item.q()`` evaluates to the value of an ``Ok``/``Some``
+    and makes ``func`` return an ``Err``/``Nothing`` right away::
+
+        @result_block
+        def load(path):
+            text = read(path).q()
+            config = parse(text).q()
+            return Ok(config)
+    """
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except _EarlyReturn as signal:
+                signal.__traceback__ = signal.__context__ = None
+                return signal.item
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except _EarlyReturn as signal:
+            # the Nothing signal is reused: drop the frames it collected
+            signal.__traceback__ = signal.__context__ = None
+            return signal.item
+
+    return wrapper
+
+
+# An expect() message: a string, %-formatted with the extra arguments if there
+# are any, or a function called with them. Either way the message is only
+# built when expect() fails.
+Message = Union[str, Callable[..., str]]
+
+
+def _panic(variant: Any, payload: Any, msg: Any = None, args: Tuple = ()) -> NoReturn:
+    if callable(msg):
+        msg = msg(*args)
+    elif args:
+        msg = msg % args
+    panic = Panic(*(() if msg is None else (msg,)), variant=variant, payload=payload)
+    if isinstance(payload, BaseException):
+        raise panic from payload
+    raise panic
 
 
 class Panic(Exception):
-    def __init__(self, *args: object) -> None:
+    """Raised when unwrapping the wrong variant.
+
+    ``variant`` is the ``Option``/``Result`` that was unwrapped and
+    ``payload`` what it holds instead of the expected value: the error of an
+    ``Err``, the value of an ``Ok``, ``None`` for ``Nothing``.
+    """
+
+    def __init__(self, *args: object, variant: Any = None, payload: Any = None):
         super().__init__(*args)
+        self.variant = variant
+        self.payload = payload
+        if _panic_hooks:
+            for hook in _panic_hooks:
+                hook(self)
 
 
 @functools.singledispatch
@@ -535,33 +1082,88 @@ def as_option(value):
     return Some(value)
 
 
+# Implementations of as_option per concrete return type, filled on first use
+# by the wrappers so that they skip singledispatch on every call. Registering
+# a new implementation clears it.
+_as_option_impls: Dict[type, Callable[[Any], "Option[Any]"]] = {}
+_as_option_register = as_option.register
+
+
+def _register_as_option(cls, func=None):
+    _as_option_impls.clear()
+    return _as_option_register(cls, func)
+
+
+as_option.register = _register_as_option  # type: ignore
+
+
+def _as_option_impl(cls: type) -> Callable[[Any], "Option[Any]"]:
+    impl = as_option.dispatch(cls)
+    if impl is as_option.registry[object]:
+        impl = Some
+    _as_option_impls[cls] = impl
+    return impl
+
+
 @as_option.register(collections.abc.Callable)
 def _(func: Callable):
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            value = await func(*args, **kwargs)
+            if value is None:
+                return _NOTHING
+            try:
+                impl = _as_option_impls[value.__class__]
+            except KeyError:
+                impl = _as_option_impl(value.__class__)
+            return impl(value)
+
+        return async_wrapper
+
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        return as_option(func(*args, **kwargs))
+        value = func(*args, **kwargs)
+        if value is None:
+            return _NOTHING
+        try:
+            impl = _as_option_impls[value.__class__]
+        except KeyError:
+            impl = _as_option_impl(value.__class__)
+        return impl(value)
 
     return wrapper
 
 
 @as_option.register(type(None))
 def _(_: None):
-    return Nothing()
+    return _NOTHING
 
 
 @functools.singledispatch
-def as_result(bases: Tuple[Type]):
-
+def as_result(
+    bases: Tuple[Type[BaseException], ...],
+    capture: Optional[Callable[[BaseException], Any]] = None,
+):
     def decorator(func: Callable):
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                try:
+                    return Ok(await func(*args, **kwargs))
+                except bases as exc:
+                    return Err(exc if capture is None else capture(exc))
+
+            return async_wrapper
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             try:
                 return Ok(func(*args, **kwargs))
-            except Exception as exc:
-                if isinstance(exc, bases):
-                    return Err(exc)
-                else:
-                    raise exc
+            except bases as exc:
+                return Err(exc if capture is None else capture(exc))
 
         return wrapper
 
@@ -571,3 +1173,33 @@ def as_result(bases: Tuple[Type]):
 @as_result.register(collections.abc.Callable)
 def _(fn: Callable):
     return as_result((Exception,))(fn)
+
+
+class Capture(Generic[T]):
+    """Context manager turning the outcome of a block into a ``Result``.
+
+    ``result`` is ``Err(exc)`` if the block raised one of ``bases`` (which is
+    then suppressed), otherwise ``Ok`` of the last value passed to ``set``::
+
+        with Capture(ValueError) as captured:
+            captured.set(int(text))
+        number = captured.result.unwrap_or(0)
+    """
+
+    __slots__ = ("bases", "result")
+
+    def __init__(self, *bases: Type[BaseException]):
+        self.bases = bases or (Exception,)
+        self.result: Result[T, BaseException] = Ok(None)
+
+    def set(self, value: T) -> None:
+        self.result = Ok(value)
+
+    def __enter__(self) -> "Capture[T]":
+        return self
+
+    def __exit__(self, exc_type, exc, _) -> bool:
+        if exc_type is not None and issubclass(exc_type, self.bases):
+            self.result = Err(exc)
+            return True
+        return False
@@ -0,0 +1,251 @@
+import asyncio
+import inspect
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generic,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from . import _ERR_TAG, Err, Ok, Result
+
+T = TypeVar("T")
+
+
+async def gather(
+    *aws: Awaitable[T],
+    limit: Optional[int] = None,
+    bases: Tuple[Type[BaseException], ...] = (Exception,),
+) -> List[Result[T, BaseException]]:
+    """Await ``aws`` concurrently and return one ``Result`` per awaitable.
+
+    Unlike ``asyncio.gather``, an exception listed in ``bases`` only turns its
+    own entry into an ``Err``: the other awaitables keep running. At most
+    ``limit`` awaitables run at the same time when it is given.
+    """
+    semaphore = asyncio.Semaphore(limit) if limit else None
+
+    async def run(aw: Awaitable[T]) -> Result[T, BaseException]:
+        try:
+            if semaphore is None:
+                return Ok(await aw)
+            async with semaphore:
+                return Ok(await aw)
+        except bases as exc:
+            return Err(exc)
+
+    return list(await asyncio.gather(*map(run, aws)))
+
+
+# returned by a filter stage for the items it drops
+_SKIP = object()
+_DONE = object()
+
+Apply = Callable[[Any], Awaitable[Any]]
+Stage = Tuple[Apply, int, int, bool]
+
+
+async def _resolve(value: Any) -> Any:
+    return await value if inspect.isawaitable(value) else value
+
+
+Bases = Tuple[Type[BaseException], ...]
+
+
+def _mapping(fn: Callable[[Any], Any], bases: Bases) -> Apply:
+    async def apply(item: Any) -> Any:
+        try:
+            return Ok(await _resolve(fn(item.value)))
+        except bases as exc:
+            return Err(exc)
+
+    return apply
+
+
+def _chaining(fn: Callable[[Any], Any], bases: Bases) -> Apply:
+    async def apply(item: Any) -> Any:
+        try:
+            return await _resolve(fn(item.value))
+        except bases as exc:
+            return Err(exc)
+
+    return apply
+
+
+def _filtering(predicate: Callable[[Any], Any], bases: Bases) -> Apply:
+    async def apply(item: Any) -> Any:
+        try:
+            return item if await _resolve(predicate(item.value)) else _SKIP
+        except bases as exc:
+            return Err(exc)
+
+    return apply
+
+
+async def _run_stage(
+    upstream: AsyncGenerator[Any, None], stage: Stage
+) -> AsyncGenerator[Any, None]:
+    """Apply a stage to the ``Ok`` items of ``upstream``, forwarding ``Err``s.
+
+    A feeder task pulls from ``upstream`` while at most ``buffer`` items are
+    held by the stage, running or waiting to be consumed, and runs at most
+    ``concurrency`` calls at once. Finished items are queued in input order
+    or as they complete.
+    """
+    apply, concurrency, buffer, ordered = stage
+    loop = asyncio.get_running_loop()
+    room = asyncio.Semaphore(buffer)
+    slots = asyncio.Semaphore(concurrency)
+    queue: "asyncio.Queue[Any]" = asyncio.Queue()
+    tasks: Set["asyncio.Future[Any]"] = set()
+
+    async def run(item: Any) -> Any:
+        async with slots:
+            return await apply(item)
+
+    async def feed() -> None:
+        try:
+            async for item in upstream:
+                await room.acquire()
+                if item._tag == _ERR_TAG:
+                    future = loop.create_future()
+                    future.set_result(item)
+                    queue.put_nowait(future)
+                    continue
+                task = asyncio.ensure_future(run(item))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+                if ordered:
+                    queue.put_nowait(task)
+                else:
+                    task.add_done_callback(queue.put_nowait)
+            if tasks:
+                await asyncio.wait(set(tasks))
+        except Exception as exc:
+            failed = loop.create_future()
+            failed.set_exception(exc)
+            queue.put_nowait(failed)
+        queue.put_nowait(_DONE)
+
+    feeder = asyncio.ensure_future(feed())
+    try:
+        while True:
+            future = await queue.get()
+            if future is _DONE:
+                break
+            result = await future
+            room.release()
+            if result is not _SKIP:
+                yield result
+        await feeder
+    finally:
+        running = (feeder, *tasks)
+        for task in running:
+            task.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
+        await upstream.aclose()
+
+
+class Stream(Generic[T]):
+    """An async pipeline of fallible stages over an async iterable.
+
+    Every value of ``source`` enters as ``Ok``. Each stage runs its function
+    on the ``Ok`` items only, with at most ``concurrency`` calls in flight,
+    and holds at most ``buffer`` items: once the consumer falls behind, the
+    stage stops pulling from the previous one. An exception listed in
+    ``bases`` turns its own item into an ``Err`` which then flows through the
+    remaining stages untouched, so a bad record never stops the stream::
+
+        stream = Stream(consumer).map(parse).and_then(store, concurrency=8)
+        async for record in stream.values(on_err=dead_letters.put):
+            ...
+
+    Iterating the stream itself yields every item as a ``Result``. Like the
+    synchronous pipelines, every builder method returns a new stream.
+    """
+
+    __slots__ = ("_source", "_stages")
+
+    def __init__(self, source: AsyncIterable[Any], stages: Tuple[Stage, ...] = ()):
+        self._source = source
+        self._stages = stages
+
+    def _then(
+        self, apply: Apply, concurrency: int, buffer: Optional[int], ordered: bool
+    ) -> "Stream[Any]":
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        buffer = 2 * concurrency if buffer is None else max(buffer, concurrency)
+        stage = (apply, concurrency, buffer, ordered)
+        return Stream(self._source, self._stages + (stage,))
+
+    def map(
+        self,
+        fn: Callable[[Any], Any],
+        *,
+        concurrency: int = 1,
+        buffer: Optional[int] = None,
+        ordered: bool = True,
+        bases: Bases = (Exception,),
+    ) -> "Stream[Any]":
+        """Replace each value by ``fn(value)``, awaited if it is awaitable."""
+        return self._then(_mapping(fn, bases), concurrency, buffer, ordered)
+
+    def and_then(
+        self,
+        fn: Callable[[Any], Any],
+        *,
+        concurrency: int = 1,
+        buffer: Optional[int] = None,
+        ordered: bool = True,
+        bases: Bases = (Exception,),
+    ) -> "Stream[Any]":
+        """Replace each item by the ``Result`` returned by ``fn(value)``."""
+        return self._then(_chaining(fn, bases), concurrency, buffer, ordered)
+
+    def filter(
+        self,
+        predicate: Callable[[Any], Any],
+        *,
+        concurrency: int = 1,
+        buffer: Optional[int] = None,
+        ordered: bool = True,
+        bases: Bases = (Exception,),
+    ) -> "Stream[T]":
+        """Drop the values for which ``predicate`` is false."""
+        return self._then(_filtering(predicate, bases), concurrency, buffer, ordered)
+
+    async def _results(self) -> AsyncGenerator[Result[Any, Any], None]:
+        source = aiter(self._source)
+        try:
+            async for value in source:
+                yield Ok(value)
+        finally:
+            # closing the stream early releases the consumer or file behind it
+            aclose = getattr(source, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    def __aiter__(self) -> AsyncGenerator[Result[Any, Any], None]:
+        items = self._results()
+        for stage in self._stages:
+            items = _run_stage(items, stage)
+        return items
+
+    async def values(self, on_err: Callable[[Err], Any]) -> AsyncIterator[Any]:
+        """Yield the ``Ok`` values and pass each ``Err`` to ``on_err``, awaiting
+        its result if it is awaitable."""
+        async for item in self:
+            if item._tag == _ERR_TAG:
+                await _resolve(on_err(item))
+            else:
+                yield item.value
@@ -0,0 +1,169 @@
+from abc import abstractmethod
+from itertools import compress
+from typing import Any, Callable, Generic, Iterable, Iterator, List, Tuple, TypeVar
+
+from . import _NOTHING, _OK_TAG, _SOME_TAG, Err, Ok, Option, Result, Some
+
+T = TypeVar("T")
+U = TypeVar("U")
+E = TypeVar("E")
+
+_INVERT = bytes.maketrans(b"\x00\x01", b"\x01\x00")
+
+
+class _MaskedArray:
+    """A list of payloads next to a ``bytearray`` with one flag byte per item.
+
+    Views (``Some``/``Nothing``, ``Ok``/``Err``) are only built when an item
+    is accessed; the bulk operations work on the list and the mask directly.
+    """
+
+    __slots__ = ("_values", "_mask")
+
+    def __init__(self, values: List[Any], mask: bytearray):
+        if len(values) != len(mask):
+            raise ValueError("values and mask must have the same length")
+        self._values = values
+        self._mask = mask
+
+    def __len__(self) -> int:
+        return len(self._mask)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return type(self)(self._values[index], self._mask[index])
+        return self._view(self._mask[index], self._values[index])
+
+    def __iter__(self) -> Iterator[Any]:
+        return map(self._view, self._mask, self._values)
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._mask == other._mask and self._values == other._values
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+    def to_list(self) -> List[Any]:
+        return list(self)
+
+    def _items(self) -> Iterator[Tuple[Any, int]]:
+        return zip(self._values, self._mask)
+
+    @staticmethod
+    @abstractmethod
+    def _view(flag: int, value: Any) -> Any:
+        ...
+
+
+class OptionArray(_MaskedArray, Generic[T]):
+    """Batch of ``Option`` values stored as a value list and a presence mask."""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_options(cls, options: Iterable[Option[T]]) -> "OptionArray[T]":
+        options = list(options)
+        mask = bytearray(option._tag == _SOME_TAG for option in options)
+        values = [option.value if flag else None for option, flag in zip(options, mask)]
+        return cls(values, mask)
+
+    @classmethod
+    def from_values(cls, values: Iterable[Any]) -> "OptionArray[Any]":
+        """Build from raw values, ``None`` marking a missing item."""
+        values = list(values)
+        return cls(values, bytearray(value is not None for value in values))
+
+    @staticmethod
+    def _view(flag: int, value: Any) -> Option[Any]:
+        return Some(value) if flag else _NOTHING
+
+    def count(self) -> int:
+        """Number of ``Some`` items."""
+        return self._mask.count(1)
+
+    def values(self) -> List[T]:
+        """Payloads of the ``Some`` items, in order."""
+        return list(compress(self._values, self._mask))
+
+    def map(self, fn: Callable[[T], U]) -> "OptionArray[U]":
+        values = [fn(value) if flag else None for value, flag in self._items()]
+        return OptionArray(values, self._mask[:])
+
+    def filter(self, predicate: Callable[[T], bool]) -> "OptionArray[T]":
+        mask = bytearray(
+            flag and bool(predicate(value)) for value, flag in self._items()
+        )
+        values = [value if flag else None for value, flag in zip(self._values, mask)]
+        return OptionArray(values, mask)
+
+    def unwrap_or(self, default: T) -> List[T]:
+        if self._mask.count(0) == 0:
+            return self._values[:]
+        return [value if flag else default for value, flag in self._items()]
+
+    def ok_or(self, err: E) -> "ResultArray[T, E]":
+        values = [value if flag else err for value, flag in self._items()]
+        return ResultArray(values, self._mask[:])
+
+
+class ResultArray(_MaskedArray, Generic[T, E]):
+    """Batch of ``Result`` values stored as a payload list and an ok mask."""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_results(cls, results: Iterable[Result[T, E]]) -> "ResultArray[T, E]":
+        results = list(results)
+        mask = bytearray(result._tag == _OK_TAG for result in results)
+        values = [
+            result.value if flag else result.error
+            for result, flag in zip(results, mask)
+        ]
+        return cls(values, mask)
+
+    @staticmethod
+    def _view(flag: int, value: Any) -> Result[Any, Any]:
+        return Ok(value) if flag else Err(value)
+
+    def count_ok(self) -> int:
+        return self._mask.count(1)
+
+    def count_err(self) -> int:
+        return self._mask.count(0)
+
+    def oks(self) -> List[T]:
+        """Payloads of the ``Ok`` items, in order."""
+        return list(compress(self._values, self._mask))
+
+    def errs(self) -> List[E]:
+        """Payloads of the ``Err`` items, in order."""
+        return list(compress(self._values, self._mask.translate(_INVERT)))
+
+    def partition(self) -> Tuple[List[T], List[E]]:
+        return self.oks(), self.errs()
+
+    def ok(self) -> OptionArray[T]:
+        values = [value if flag else None for value, flag in self._items()]
+        return OptionArray(values, self._mask[:])
+
+    def err(self) -> OptionArray[E]:
+        mask = self._mask.translate(_INVERT)
+        values = [value if flag else None for value, flag in zip(self._values, mask)]
+        return OptionArray(values, mask)
+
+    def map(self, fn: Callable[[T], U]) -> "ResultArray[U, E]":
+        values = [fn(value) if flag else value for value, flag in self._items()]
+        return ResultArray(values, self._mask[:])
+
+    def map_err(self, fn: Callable[[E], U]) -> "ResultArray[T, U]":
+        values = [value if flag else fn(value) for value, flag in self._items()]
+        return ResultArray(values, self._mask[:])
+
+    def unwrap_or(self, default: T) -> List[T]:
+        if self._mask.count(0) == 0:
+            return self._values[:]
+        return [value if flag else default for value, flag in self._items()]
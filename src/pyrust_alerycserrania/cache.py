@@ -0,0 +1,216 @@
+import asyncio
+import collections
+import functools
+import inspect
+import threading
+import time
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple, Union
+
+from . import _ERR_TAG, _NOTHING_TAG
+
+_KWARGS_MARK = object()
+
+
+def _make_key(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any:
+    return args + (_KWARGS_MARK,) + tuple(kwargs.items()) if kwargs else args
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    negative_hits: int
+    misses: int
+    evictions: int
+    currsize: int
+    negative_currsize: int
+
+
+class _Flight:
+    """A call in progress that concurrent callers with the same key wait on."""
+
+    __slots__ = ("done", "result", "exception")
+
+    def __init__(self, done: Union[threading.Event, asyncio.Event]):
+        self.done = done
+        self.result: Any = None
+        self.exception: Optional[BaseException] = None
+
+    def outcome(self) -> Any:
+        if self.exception is not None:
+            raise self.exception
+        return self.result
+
+
+class _Store:
+    """An LRU mapping of key to ``(expiry, value)`` with an optional TTL."""
+
+    __slots__ = ("entries", "maxsize", "ttl")
+
+    def __init__(self, maxsize: Optional[int], ttl: Optional[float]):
+        self.entries: "collections.OrderedDict[Any, Tuple[Optional[float], Any]]"
+        self.entries = collections.OrderedDict()
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+    def get(self, key: Any, now: float) -> Tuple[bool, Any]:
+        try:
+            expiry, value = self.entries[key]
+        except KeyError:
+            return False, None
+        if expiry is not None and expiry <= now:
+            del self.entries[key]
+            return False, None
+        self.entries.move_to_end(key)
+        return True, value
+
+    def put(self, key: Any, value: Any, now: float) -> int:
+        """Store ``value`` and return the number of evicted entries."""
+        expiry = None if self.ttl is None else now + self.ttl
+        self.entries[key] = (expiry, value)
+        self.entries.move_to_end(key)
+        evicted = 0
+        if self.maxsize is not None:
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                evicted += 1
+        return evicted
+
+
+def cached(
+    func: Optional[Callable] = None,
+    *,
+    maxsize: Optional[int] = 128,
+    ttl: Optional[float] = None,
+    negative_ttl: Optional[float] = None,
+    negative_maxsize: Optional[int] = None,
+    timer: Callable[[], float] = time.monotonic,
+):
+    """Memoize a function returning ``Option``/``Result`` values.
+
+    ``Ok``/``Some`` results go to an LRU cache of ``maxsize`` entries, expiring
+    after ``ttl`` seconds if given. ``Err``/``Nothing`` results are only cached
+    when ``negative_ttl`` is given, in a separate LRU cache (of
+    ``negative_maxsize`` entries, ``maxsize`` by default) so that failures
+    neither evict successes nor outlive ``negative_ttl``.
+
+    Concurrent calls with the same arguments wait for the first one instead
+    of all calling ``func``. Coroutine functions are awaited and their result
+    cached; concurrent calls share a call when they run on the same event
+    loop. Stack it over ``as_result``/``as_option``::
+
+        @cached(maxsize=1024, ttl=60, negative_ttl=5)
+        @as_result
+        def fetch(key): ...
+
+    The wrapper exposes ``cache_info()`` and ``cache_clear()``.
+    """
+
+    def decorator(func: Callable):
+        lock = threading.Lock()
+        positive = _Store(maxsize, ttl)
+        negative = _Store(
+            maxsize if negative_maxsize is None else negative_maxsize, negative_ttl
+        )
+        flights: Dict[Any, _Flight] = {}
+        stats = {"hits": 0, "negative_hits": 0, "misses": 0, "evictions": 0}
+
+        def cache_info() -> CacheInfo:
+            with lock:
+                return CacheInfo(
+                    currsize=len(positive.entries),
+                    negative_currsize=len(negative.entries),
+                    **stats,
+                )
+
+        def cache_clear() -> None:
+            with lock:
+                positive.entries.clear()
+                negative.entries.clear()
+                stats.update(dict.fromkeys(stats, 0))
+
+        def expose(wrapper: Callable) -> Callable:
+            wrapper.cache_info = cache_info  # type: ignore
+            wrapper.cache_clear = cache_clear  # type: ignore
+            return wrapper
+
+        def lookup(key: Any, event: Callable[[], Any]) -> Tuple[bool, Any, bool]:
+            """``(True, value, _)`` on a hit, else ``(False, flight, leader)``."""
+            with lock:
+                now = timer()
+                found, value = positive.get(key, now)
+                if found:
+                    stats["hits"] += 1
+                    return True, value, False
+                if negative_ttl is not None:
+                    found, value = negative.get(key, now)
+                    if found:
+                        stats["negative_hits"] += 1
+                        return True, value, False
+                stats["misses"] += 1
+                flight = flights.get(key)
+                if flight is not None:
+                    return False, flight, False
+                flight = flights[key] = _Flight(event())
+                return False, flight, True
+
+        def land(
+            key: Any,
+            flight: _Flight,
+            value: Any,
+            exception: Optional[BaseException] = None,
+        ) -> None:
+            """Cache the outcome of the call led by ``flight`` and wake its waiters."""
+            flight.result = value
+            flight.exception = exception
+            tag = getattr(value, "_tag", None)
+            with lock:
+                if exception is None:
+                    if tag != _ERR_TAG and tag != _NOTHING_TAG:
+                        stats["evictions"] += positive.put(key, value, timer())
+                    elif negative_ttl is not None:
+                        stats["evictions"] += negative.put(key, value, timer())
+                del flights[key]
+            flight.done.set()
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                key = _make_key(args, kwargs)
+                found, value, leader = lookup(key, asyncio.Event)
+                if found:
+                    return value
+                flight = value
+                if not leader:
+                    await flight.done.wait()
+                    return flight.outcome()
+                try:
+                    value = await func(*args, **kwargs)
+                except BaseException as exc:
+                    land(key, flight, None, exc)
+                    raise
+                land(key, flight, value)
+                return value
+
+            return expose(async_wrapper)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = _make_key(args, kwargs)
+            found, value, leader = lookup(key, threading.Event)
+            if found:
+                return value
+            flight = value
+            if not leader:
+                flight.done.wait()
+                return flight.outcome()
+            try:
+                value = func(*args, **kwargs)
+            except BaseException as exc:
+                land(key, flight, None, exc)
+                raise
+            land(key, flight, value)
+            return value
+
+        return expose(wrapper)
+
+    return decorator if func is None else decorator(func)
@@ -0,0 +1,86 @@
+import json
+import traceback
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional, Tuple, Type, Union
+
+Codes = Mapping[Type[BaseException], Any]
+
+
+class ErrorRecord(NamedTuple):
+    """Picklable summary of an exception that keeps no frame alive.
+
+    ``type`` is the qualified name of the exception class and ``frames`` the
+    innermost frames of its traceback, formatted as ``file:line in function``.
+    """
+
+    type: str
+    message: str
+    frames: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_exception(cls, exc: BaseException, frames: int = 0) -> "ErrorRecord":
+        kind = type(exc)
+        name = kind.__qualname__
+        if kind.__module__ != "builtins":
+            name = f"{kind.__module__}.{name}"
+        summary: Tuple[str, ...] = ()
+        if frames:
+            summary = tuple(
+                f"{frame.filename}:{frame.lineno} in {frame.name}"
+                for frame in traceback.extract_tb(exc.__traceback__)[-frames:]
+            )
+        return cls(name, str(exc), summary)
+
+    @classmethod
+    def from_json(cls, data: Union[str, bytes]) -> "ErrorRecord":
+        """Rebuild a record serialized as a JSON array."""
+        name, message, frames = json.loads(data)
+        return cls(name, message, tuple(frames))
+
+
+def strip_traceback(exc: BaseException) -> BaseException:
+    """Drop the tracebacks of ``exc`` and of its causes and contexts.
+
+    The exception object is kept, so it can still be matched and re-raised,
+    but it no longer pins the frames and locals of the failing call.
+    """
+    seen = set()
+    pending: List[Optional[BaseException]] = [exc]
+    while pending:
+        current = pending.pop()
+        if current is None or id(current) in seen:
+            continue
+        seen.add(id(current))
+        current.__traceback__ = None
+        pending.append(current.__cause__)
+        pending.append(current.__context__)
+    return exc
+
+
+def summarize(
+    frames: int = 0, codes: Optional[Codes] = None
+) -> Callable[[BaseException], Any]:
+    """Build a ``capture`` function for ``as_result``.
+
+    Exceptions whose class, or one of its bases, is a key of ``codes`` are
+    replaced by the mapped code. Any other exception becomes an
+    ``ErrorRecord`` keeping the ``frames`` innermost frames::
+
+        @as_result((Exception,), capture=summarize(codes={KeyError: "missing"}))
+        def lookup(key): ...
+    """
+    codes = dict(codes or {})
+    by_type: Dict[type, Any] = {}
+    missing = object()
+
+    def capture(exc: BaseException) -> Any:
+        kind = type(exc)
+        try:
+            code = by_type[kind]
+        except KeyError:
+            base = next((base for base in kind.__mro__ if base in codes), None)
+            code = by_type[kind] = missing if base is None else codes[base]
+        if code is missing:
+            return ErrorRecord.from_exception(exc, frames)
+        return code
+
+    return capture
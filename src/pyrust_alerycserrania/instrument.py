@@ -0,0 +1,184 @@
+"""Opt-in instrumentation of ``Err`` creation, ``Panic`` and decorated calls.
+
+Global hooks registered with ``add_err_hook``/``add_panic_hook`` run for every
+``Err`` created and every ``Panic`` raised. ``instrumented`` wraps a function
+returning ``Result``/``Option`` values to record its latency histogram, failure
+counters and a sample of the call sites of its failures.
+
+Instrumentation is disabled unless ``enable()`` is called, or the
+``PYRUST_INSTRUMENT`` environment variable is set, before the functions are
+decorated: while it is disabled ``instrumented`` returns the function itself,
+so undecorated and decorated calls cost exactly the same.
+"""
+import collections
+import functools
+import inspect
+import os
+import random
+import sys
+import threading
+import time
+from typing import Any, Callable, Counter, Deque, Dict, List, Optional
+
+from . import _ERR_TAG, _NOTHING_TAG, _err_hooks, _panic_hooks
+
+_enabled = bool(os.environ.get("PYRUST_INSTRUMENT"))
+
+
+def enable() -> None:
+    global _enabled
+    _enabled = True
+
+
+def disable() -> None:
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def add_err_hook(hook: Callable[[Any], None]) -> None:
+    """Call ``hook`` with every ``Err`` created from now on."""
+    _err_hooks.append(hook)
+
+
+def remove_err_hook(hook: Callable[[Any], None]) -> None:
+    _err_hooks.remove(hook)
+
+
+def add_panic_hook(hook: Callable[[Any], None]) -> None:
+    """Call ``hook`` with every ``Panic`` raised from now on."""
+    _panic_hooks.append(hook)
+
+
+def remove_panic_hook(hook: Callable[[Any], None]) -> None:
+    _panic_hooks.remove(hook)
+
+
+class CallStats:
+    """Counters of an instrumented function.
+
+    ``latency`` is a histogram of call durations: bucket ``i`` counts the
+    calls that took less than ``2 ** i`` and at least ``2 ** (i - 1)``
+    nanoseconds.
+    """
+
+    def __init__(self, name: str, max_samples: int):
+        self.name = name
+        self.calls = 0
+        self.failures = 0
+        self.error_types: Counter[str] = collections.Counter()
+        self.latency: List[int] = [0] * 64
+        self.samples: Deque[str] = collections.deque(maxlen=max_samples)
+        self._lock = threading.Lock()
+
+    @property
+    def failure_rate(self) -> float:
+        return self.failures / self.calls if self.calls else 0.0
+
+    def percentile(self, fraction: float) -> int:
+        """Upper bound, in nanoseconds, of the given fraction of call latencies."""
+        threshold = fraction * self.calls
+        seen = 0
+        for bucket, count in enumerate(self.latency):
+            seen += count
+            if count and seen >= threshold:
+                return 2**bucket
+        return 0
+
+    def record(self, elapsed: int, result: Any, sample: Optional[str]) -> None:
+        with self._lock:
+            self.calls += 1
+            self.latency[min(elapsed.bit_length(), 63)] += 1
+            tag = getattr(result, "_tag", None)
+            if tag == _ERR_TAG:
+                self.failures += 1
+                self.error_types[type(result.error).__qualname__] += 1
+            elif tag == _NOTHING_TAG:
+                self.failures += 1
+                self.error_types["Nothing"] += 1
+            else:
+                return
+            if sample is not None:
+                self.samples.append(sample)
+
+    def __repr__(self) -> str:
+        return (
+            f"CallStats({self.name!r}, calls={self.calls}, "
+            f"failures={self.failures}, p50={self.percentile(0.5)}ns, "
+            f"p99={self.percentile(0.99)}ns)"
+        )
+
+
+_registry: Dict[str, CallStats] = {}
+
+
+def stats() -> Dict[str, CallStats]:
+    """Statistics of every instrumented function, by qualified name."""
+    return dict(_registry)
+
+
+def _call_site(depth: int) -> str:
+    frame = sys._getframe(depth)
+    return f"{frame.f_code.co_filename}:{frame.f_lineno} in {frame.f_code.co_name}"
+
+
+def instrumented(
+    func: Optional[Callable] = None,
+    *,
+    on_failure: Optional[Callable[[Any], None]] = None,
+    sample_rate: float = 0.0,
+    max_samples: int = 100,
+):
+    """Record latency and failures of a function returning ``Result``/``Option``.
+
+    ``on_failure`` is called with every ``Err``/``Nothing`` the function
+    returns, and the call site of a ``sample_rate`` fraction of them is kept in
+    ``stats.samples``. The statistics are available as the ``stats`` attribute
+    of the wrapper and through ``stats()``.
+    """
+
+    def decorator(func: Callable):
+        if not _enabled:
+            return func
+
+        name = f"{func.__module__}.{func.__qualname__}"
+        call_stats = _registry[name] = CallStats(name, max_samples)
+        clock = time.perf_counter_ns
+
+        def finish(start: int, result: Any) -> None:
+            tag = getattr(result, "_tag", None)
+            failed = tag == _ERR_TAG or tag == _NOTHING_TAG
+            sample = None
+            if failed:
+                if on_failure is not None:
+                    on_failure(result)
+                if sample_rate and random.random() < sample_rate:
+                    sample = _call_site(3)
+            call_stats.record(clock() - start, result, sample)
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                start = clock()
+                result = await func(*args, **kwargs)
+                finish(start, result)
+                return result
+
+            async_wrapper.stats = call_stats  # type: ignore
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = clock()
+            result = func(*args, **kwargs)
+            finish(start, result)
+            return result
+
+        wrapper.stats = call_stats  # type: ignore
+        return wrapper
+
+    return decorator if func is None else decorator(func)
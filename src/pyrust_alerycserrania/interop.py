@@ -0,0 +1,120 @@
+"""Conversions between batches of ``Option``/``Result`` values and NumPy masked
+arrays or pandas nullable arrays.
+
+``numpy`` and ``pandas`` are optional: they are imported by the functions that
+need them, the first time one of them is called.
+"""
+from itertools import compress
+from typing import Any, Callable, Iterable, Union
+
+from .arrays import OptionArray, ResultArray, _MaskedArray
+from .iterators import _HAS_VALUE, Item
+
+
+def _split(items: Union[Iterable[Item], _MaskedArray]):
+    """Payloads, ``None`` where missing, and the presence flags of ``items``."""
+    if isinstance(items, ResultArray):
+        return items.ok()._values, items._mask
+    if isinstance(items, OptionArray):
+        return items._values, items._mask
+    items = list(items)
+    has_value = _HAS_VALUE
+    mask = bytearray(has_value[item._tag] for item in items)
+    values = [item.value if flag else None for item, flag in zip(items, mask)]
+    return values, mask
+
+
+def _flags(mask: Any) -> bytearray:
+    """Presence flags from a boolean array flagging the missing items."""
+    import numpy
+
+    present = numpy.logical_not(numpy.asarray(mask))
+    return bytearray(present.view(numpy.uint8).tobytes())
+
+
+def to_masked(items: Union[Iterable[Item], _MaskedArray], dtype: Any = None):
+    """A ``numpy.ma.MaskedArray`` of the ``Some``/``Ok`` values of ``items``,
+    masked where they are ``Nothing``/``Err``."""
+    import numpy
+
+    values, mask = _split(items)
+    if mask.count(0):
+        # any present value keeps the dtype inferred from the payloads
+        placeholder = next(compress(values, mask), 0)
+        values = [value if flag else placeholder for value, flag in zip(values, mask)]
+    missing = numpy.frombuffer(bytes(mask), dtype=numpy.bool_) == 0
+    return numpy.ma.MaskedArray(numpy.array(values, dtype=dtype), mask=missing)
+
+
+def options_from_masked(array: Any) -> OptionArray[Any]:
+    """``Some`` for every unmasked item of ``array``, ``Nothing`` elsewhere."""
+    import numpy
+
+    array = numpy.ma.asanyarray(array)
+    values = array.astype(object).filled(None).tolist()
+    return OptionArray(values, _flags(numpy.ma.getmaskarray(array)))
+
+
+def results_from_masked(array: Any, err: Any) -> ResultArray[Any, Any]:
+    """``Ok`` for every unmasked item of ``array``, ``Err(err)`` elsewhere."""
+    import numpy
+
+    array = numpy.ma.asanyarray(array)
+    flags = _flags(numpy.ma.getmaskarray(array))
+    values = array.astype(object).filled(None).tolist()
+    if flags.count(0):
+        values = [value if flag else err for value, flag in zip(values, flags)]
+    return ResultArray(values, flags)
+
+
+def to_nullable(items: Union[Iterable[Item], _MaskedArray], dtype: Any = None):
+    """A pandas nullable array of the ``Some``/``Ok`` values of ``items``, with
+    ``pandas.NA`` where they are ``Nothing``/``Err``."""
+    import pandas
+
+    values, _ = _split(items)
+    return pandas.array(values, dtype=dtype)
+
+
+def options_from_nullable(array: Any) -> OptionArray[Any]:
+    """``Some`` for every non missing item of a pandas array or series."""
+    import pandas
+
+    values = pandas.array(array).to_numpy(dtype=object, na_value=None).tolist()
+    return OptionArray(values, _flags(pandas.isna(array)))
+
+
+def results_from_nullable(array: Any, err: Any) -> ResultArray[Any, Any]:
+    """``Ok`` for every non missing item of a pandas array or series,
+    ``Err(err)`` elsewhere."""
+    import pandas
+
+    flags = _flags(pandas.isna(array))
+    values = pandas.array(array).to_numpy(dtype=object, na_value=None).tolist()
+    if flags.count(0):
+        values = [value if flag else err for value, flag in zip(values, flags)]
+    return ResultArray(values, flags)
+
+
+def map_values(fn: Callable[[Any], Any], array: Any) -> Any:
+    """Apply the vectorized ``fn`` to the values of a masked or nullable array.
+
+    ``fn`` runs once on the whole underlying array; missing items stay
+    missing.
+    """
+    import numpy
+
+    if isinstance(array, numpy.ma.MaskedArray):
+        mask = numpy.ma.getmaskarray(array)
+        return numpy.ma.MaskedArray(fn(array.data), mask=mask.copy())
+    # pandas nullable arrays propagate their mask through numpy functions
+    return fn(array)
+
+
+def unwrap_or(array: Any, default: Any) -> Any:
+    """The values of a masked or nullable array, ``default`` where missing."""
+    import numpy
+
+    if isinstance(array, numpy.ma.MaskedArray):
+        return array.filled(default)
+    return array.fillna(default)
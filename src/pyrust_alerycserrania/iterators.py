@@ -0,0 +1,142 @@
+import collections
+import operator
+from typing import Any, Callable, Deque, Iterable, Iterator, List, Optional, Tuple, TypeVar, Union
+
+from . import _ERR_TAG, _NOTHING, _NOTHING_TAG, _OK_TAG, Ok, Option, Result, Some
+
+T = TypeVar("T")
+E = TypeVar("E")
+A = TypeVar("A")
+D = TypeVar("D")
+
+Item = Union[Option[T], Result[T, E]]
+
+# indexed by variant tag: whether the variant holds a ``value``
+_HAS_VALUE = (False, True, True, False)
+
+
+def collect_results(results: Iterable[Result[T, E]]) -> Result[List[T], E]:
+    """``Ok`` of every value, or the first ``Err``.
+
+    The source is not consumed past the first ``Err``.
+    """
+    values: List[T] = []
+    append = values.append
+    for result in results:
+        if result._tag == _ERR_TAG:
+            return result
+        append(result.value)
+    return Ok(values)
+
+
+def collect_options(options: Iterable[Option[T]]) -> Option[List[T]]:
+    """``Some`` of every value, or ``Nothing`` at the first ``Nothing``.
+
+    The source is not consumed past the first ``Nothing``.
+    """
+    values: List[T] = []
+    append = values.append
+    for option in options:
+        if option._tag == _NOTHING_TAG:
+            return _NOTHING
+        append(option.value)
+    return Some(values)
+
+
+def fold_results(
+    results: Iterable[Result[T, E]], init: A, fn: Callable[[A, T], A]
+) -> Result[A, E]:
+    """Fold the ``Ok`` values with ``fn``, stopping at the first ``Err``."""
+    acc = init
+    for result in results:
+        if result._tag == _ERR_TAG:
+            return result
+        acc = fn(acc, result.value)
+    return Ok(acc)
+
+
+def fold_options(
+    options: Iterable[Option[T]], init: A, fn: Callable[[A, T], A]
+) -> Option[A]:
+    """Fold the ``Some`` values with ``fn``, stopping at the first ``Nothing``."""
+    acc = init
+    for option in options:
+        if option._tag == _NOTHING_TAG:
+            return _NOTHING
+        acc = fn(acc, option.value)
+    return Some(acc)
+
+
+def sum_results(results: Iterable[Result[T, E]], start: Any = 0) -> Result[Any, E]:
+    return fold_results(results, start, operator.add)
+
+
+def sum_options(options: Iterable[Option[T]], start: Any = 0) -> Option[Any]:
+    return fold_options(options, start, operator.add)
+
+
+def partition(results: Iterable[Result[T, E]]) -> Tuple[Iterator[T], Iterator[E]]:
+    """Split ``results`` into a lazy iterator of values and one of errors.
+
+    Both iterators pull from the same pass over ``results``. An item is only
+    buffered when it is read from the source on behalf of the other iterator,
+    so consuming both side by side keeps memory bounded.
+    """
+    source = iter(results)
+    oks: Deque[T] = collections.deque()
+    errs: Deque[E] = collections.deque()
+
+    def values() -> Iterator[T]:
+        while True:
+            while oks:
+                yield oks.popleft()
+            for result in source:
+                if result._tag == _ERR_TAG:
+                    errs.append(result.error)
+                else:
+                    yield result.value
+                    break
+            else:
+                return
+
+    def errors() -> Iterator[E]:
+        while True:
+            while errs:
+                yield errs.popleft()
+            for result in source:
+                if result._tag == _ERR_TAG:
+                    yield result.error
+                    break
+                else:
+                    oks.append(result.value)
+            else:
+                return
+
+    return values(), errors()
+
+
+def flatten(items: Iterable[Item]) -> Iterator[T]:
+    """The values of the ``Some``/``Ok`` items, skipping ``Nothing``/``Err``."""
+    has_value = _HAS_VALUE
+    return (item.value for item in items if has_value[item._tag])
+
+
+def filter_map(fn: Callable[[A], Item], iterable: Iterable[A]) -> Iterator[T]:
+    """Apply ``fn``, returning an ``Option``/``Result``, and keep the values."""
+    return flatten(map(fn, iterable))
+
+
+def ok_values(results: Iterable[Result[T, E]]) -> Iterator[T]:
+    return (result.value for result in results if result._tag == _OK_TAG)
+
+
+def err_values(results: Iterable[Result[T, E]]) -> Iterator[E]:
+    return (result.error for result in results if result._tag == _ERR_TAG)
+
+
+def unwrap_or_default(
+    items: Iterable[Item], default: Optional[D] = None
+) -> Iterator[Union[T, Optional[D]]]:
+    """The value of each ``Some``/``Ok`` item, ``default`` for the others."""
+    has_value = _HAS_VALUE
+    return (item.value if has_value[item._tag] else default for item in items)
@@ -0,0 +1,169 @@
+import threading
+from typing import Any, Callable, Dict, Optional, Union
+
+from . import Option, Result, _immutable
+
+Item = Union[Option[Any], Result[Any, Any]]
+
+# value of ``_forced`` until the thunk has run
+_PENDING = object()
+
+
+class _Lazy:
+    """An ``Option``/``Result`` computed by ``thunk`` the first time it is
+    inspected, then cached.
+
+    ``thunk`` runs at most once, even when several threads inspect the value
+    at the same time; if it raises, the exception propagates and the next
+    inspection calls it again.
+    """
+
+    __slots__ = ("_thunk", "_forced", "_lock")
+
+    __setattr__ = _immutable
+    __delattr__ = _immutable
+
+    def __init__(self, thunk: Callable[[], Any]):
+        object.__setattr__(self, "_thunk", thunk)
+        object.__setattr__(self, "_forced", _PENDING)
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    def force(self) -> Any:
+        """The computed ``Option``/``Result``."""
+        forced = self._forced
+        if forced is _PENDING:
+            with self._lock:
+                forced = self._forced
+                if forced is _PENDING:
+                    forced = self._thunk()
+                    if getattr(forced, "_tag", None) is None:
+                        raise TypeError(
+                            f"{type(self).__name__} thunk returned {forced!r}, "
+                            "not an Option or a Result"
+                        )
+                    object.__setattr__(self, "_forced", forced)
+                    # release whatever the thunk holds on to
+                    object.__setattr__(self, "_thunk", None)
+        return forced
+
+    def is_forced(self) -> bool:
+        return self._forced is not _PENDING
+
+    @property
+    def _tag(self) -> int:
+        return self.force()._tag
+
+    @property
+    def value(self) -> Any:
+        return self.force().value
+
+    @property
+    def error(self) -> Any:
+        return self.force().error
+
+    def __reduce__(self):
+        return self.force().__reduce__()
+
+    def __repr__(self) -> str:
+        forced = self._forced
+        pending = "<pending>" if forced is _PENDING else repr(forced)
+        return f"{type(self).__name__}({pending})"
+
+    def __eq__(self, other):
+        return self.force().__eq__(other)
+
+    def __ne__(self, other):
+        return self.force().__ne__(other)
+
+    def __lt__(self, other):
+        return self.force().__lt__(other)
+
+    def __le__(self, other):
+        return self.force().__le__(other)
+
+    def __gt__(self, other):
+        return self.force().__gt__(other)
+
+    def __ge__(self, other):
+        return self.force().__ge__(other)
+
+    def __hash__(self):
+        return hash(self.force())
+
+    def __bool__(self):
+        return bool(self.force())
+
+    def __iter__(self):
+        return iter(self.force())
+
+
+class LazyOption(_Lazy, Option[Any]):
+    """An ``Option`` returned by ``thunk`` on first use::
+
+        config = LazyOption(lambda: as_option(load_config)(path))
+    """
+
+    __slots__ = ()
+
+
+class LazyResult(_Lazy, Result[Any, Any]):
+    """A ``Result`` returned by ``thunk`` on first use::
+
+        user = LazyResult(lambda: as_result(fetch_user)(user_id))
+    """
+
+    __slots__ = ()
+
+
+def _forcing(name: str) -> Callable:
+    def method(self, *args, **kwargs):
+        return getattr(self.force(), name)(*args, **kwargs)
+
+    method.__name__ = name
+    return method
+
+
+def _deferred(name: str, lazy: type) -> Callable:
+    def method(self, *args, **kwargs):
+        return lazy(lambda: getattr(self.force(), name)(*args, **kwargs))
+
+    method.__name__ = name
+    return method
+
+
+# Combinators returning another Option/Result stay lazy; the others force the
+# value and return what the computed Option/Result returns.
+_DEFERRED: Dict[type, Dict[str, type]] = {
+    LazyOption: {
+        "map": LazyOption,
+        "and_": LazyOption,
+        "and_then": LazyOption,
+        "filter": LazyOption,
+        "or_": LazyOption,
+        "or_else": LazyOption,
+        "xor": LazyOption,
+        "ok_or": LazyResult,
+        "ok_or_else": LazyResult,
+    },
+    LazyResult: {
+        "map": LazyResult,
+        "map_err": LazyResult,
+        "and_": LazyResult,
+        "and_then": LazyResult,
+        "or_": LazyResult,
+        "or_else": LazyResult,
+        "flatten": LazyResult,
+        "ok": LazyOption,
+        "err": LazyOption,
+    },
+}
+
+for _cls, _base in ((LazyOption, Option), (LazyResult, Result)):
+    for _name, _attr in vars(_base).items():
+        if getattr(_attr, "__isabstractmethod__", False):
+            _lazy: Optional[type] = _DEFERRED[_cls].get(_name)
+            setattr(
+                _cls,
+                _name,
+                _forcing(_name) if _lazy is None else _deferred(_name, _lazy),
+            )
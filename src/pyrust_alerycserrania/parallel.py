@@ -0,0 +1,119 @@
+import collections
+import itertools
+import math
+import os
+import pickle
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Callable, Iterable, Iterator, List, Optional, Sized, Tuple, Type, TypeVar, Union
+
+from . import _ERR_TAG, Err, Result, as_result
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+Bases = Tuple[Type[BaseException], ...]
+
+# chunks in flight per worker, which also sets the default process chunksize
+_CHUNKS_PER_WORKER = 4
+# default process chunksize when the number of items is unknown
+_CHUNKSIZE = 256
+
+
+class RemoteError(Exception):
+    """Stands in for an exception that could not be pickled back from a worker
+    process. ``args`` is ``(qualified type name, str(exception))``."""
+
+
+def _run_chunk(
+    fn: Callable[[T], U], bases: Bases, chunk: List[T], portable: bool
+) -> List[Result[U, BaseException]]:
+    results: List[Result[U, BaseException]] = list(map(as_result(bases)(fn), chunk))
+    if portable:
+        for index, result in enumerate(results):
+            if result._tag == _ERR_TAG:
+                try:
+                    pickle.dumps(result.error)
+                except Exception:
+                    error = result.error
+                    name = f"{type(error).__module__}.{type(error).__qualname__}"
+                    results[index] = Err(RemoteError(name, str(error)))
+    return results
+
+
+def _chunks(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    iterator = iter(items)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def try_map(
+    fn: Callable[[T], U],
+    items: Iterable[T],
+    executor: Union[Executor, int, None] = None,
+    *,
+    processes: bool = False,
+    chunksize: Optional[int] = None,
+    ordered: bool = True,
+    bases: Bases = (Exception,),
+) -> Iterator[Result[U, BaseException]]:
+    """Apply ``fn`` to every item in parallel and yield one ``Result`` per item.
+
+    ``executor`` is either an existing executor, which is left running, or
+    the number of workers of a pool created for the call and shut down once
+    the returned iterator is exhausted or closed. ``processes`` selects a
+    process pool instead of a thread pool in that case.
+
+    Items are sent to the workers in chunks of ``chunksize``. By default
+    thread pools get one item per task, and process pools about four chunks
+    per worker, or chunks of 256 items when ``items`` has no length, to
+    amortize the cost of pickling. Items are pulled lazily: at most four
+    chunks per worker are in flight, and more are submitted as they complete.
+    Results are yielded in input order, or as their chunks complete when
+    ``ordered`` is false. Exceptions outside of ``bases`` propagate to the
+    caller.
+    """
+    if isinstance(executor, Executor):
+        return _try_map(fn, items, executor, chunksize, ordered, bases)
+    return _try_map_owned(fn, items, executor, processes, chunksize, ordered, bases)
+
+
+def _try_map_owned(fn, items, workers, processes, chunksize, ordered, bases):
+    pool = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    with pool(workers) as executor:
+        yield from _try_map(fn, items, executor, chunksize, ordered, bases)
+
+
+def _try_map(fn, items, executor, chunksize, ordered, bases):
+    portable = isinstance(executor, ProcessPoolExecutor)
+    workers = getattr(executor, "_max_workers", None) or os.cpu_count() or 1
+    if chunksize is None:
+        if not portable:
+            chunksize = 1
+        elif isinstance(items, Sized):
+            chunksize = max(1, math.ceil(len(items) / (workers * _CHUNKS_PER_WORKER)))
+        else:
+            chunksize = _CHUNKSIZE
+
+    chunks = _chunks(items, chunksize)
+
+    def submit(count: int):
+        for chunk in itertools.islice(chunks, count):
+            yield executor.submit(_run_chunk, fn, bases, chunk, portable)
+
+    pending = collections.deque(submit(workers * _CHUNKS_PER_WORKER))
+    try:
+        if ordered:
+            while pending:
+                results = pending.popleft().result()
+                pending.extend(submit(1))
+                yield from results
+        else:
+            while pending:
+                done, waiting = wait(pending, return_when=FIRST_COMPLETED)
+                pending = collections.deque(waiting)
+                pending.extend(submit(len(done)))
+                for future in done:
+                    yield from future.result()
+    finally:
+        for future in pending:
+            future.cancel()
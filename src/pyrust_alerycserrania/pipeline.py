@@ -0,0 +1,191 @@
+from typing import Any, Callable, Dict, Generic, Iterable, Iterator, List, Tuple, TypeVar
+
+from . import _ERR_TAG, _NOTHING, _NOTHING_TAG, Err, Ok, Some
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+Step = Tuple[str, Tuple[Any, ...]]
+
+
+class _Pipeline(Generic[T]):
+    """A chain of combinators compiled into a single Python function.
+
+    Every builder method returns a new pipeline, so a partial pipeline can be
+    shared and extended. The chain is compiled on first use: the compiled
+    function passes the bare value from one step to the next, returns as soon
+    as a step misses, and only wraps the outcome once.
+    """
+
+    __slots__ = ("_steps", "_terminal", "_run")
+    _success: str
+
+    def __init__(self, steps: Tuple[Step, ...] = (), terminal: Step = None):
+        self._steps = steps
+        self._terminal = terminal
+        self._run: Callable[[Any], Any] = None
+
+    def _then(self, kind: str, *args):
+        if self._terminal is not None:
+            raise TypeError(f"cannot call {kind}() after {self._terminal[0]}()")
+        return type(self)(self._steps + ((kind, args),))
+
+    def _end(self, kind: str, *args):
+        if self._terminal is not None:
+            raise TypeError(f"cannot call {kind}() after {self._terminal[0]}()")
+        return type(self)(self._steps, (kind, args))
+
+    def map(self, fn: Callable[[Any], Any]):
+        return self._then("map", fn)
+
+    def inspect(self, fn: Callable[[Any], None]):
+        return self._then("inspect", fn)
+
+    def and_then(self, fn: Callable[[Any], Any]):
+        return self._then("and_then", fn)
+
+    def map_or(self, default: U, fn: Callable[[Any], U]):
+        return self._end("map_or", default, fn)
+
+    def map_or_else(self, default: Callable[[], U], fn: Callable[[Any], U]):
+        return self._end("map_or_else", default, fn)
+
+    def unwrap_or(self, default: Any):
+        return self._end("unwrap_or", default)
+
+    def compile(self) -> Callable[[Any], Any]:
+        """Return the compiled chain as a plain function of the input value."""
+        if self._run is None:
+            self._run = self._compile()
+        return self._run
+
+    def __call__(self, value: Any) -> Any:
+        return self.compile()(value)
+
+    def over(self, values: Iterable[Any]) -> Iterator[Any]:
+        """Lazily run the pipeline on every value of ``values``."""
+        return map(self.compile(), values)
+
+    def _missed(self, missing: Any) -> Any:
+        if self._terminal is None:
+            return missing
+        kind, args = self._terminal
+        return args[0]() if kind == "map_or_else" else args[0]
+
+    def _compile(self) -> Callable[[Any], Any]:
+        namespace: Dict[str, Any] = {
+            "Some": Some,
+            "Ok": Ok,
+            "Err": Err,
+            "NOTHING": _NOTHING,
+            "ERR_TAG": _ERR_TAG,
+            "NOTHING_TAG": _NOTHING_TAG,
+        }
+        body: List[str] = []
+        for index, (kind, args) in enumerate(self._steps):
+            namespace.update((f"f{index}_{i}", arg) for i, arg in enumerate(args))
+            body.extend(getattr(self, f"_emit_{kind}")(index, f"f{index}_0"))
+
+        if self._terminal is None:
+            body.append(f"return {self._success}")
+        else:
+            kind, args = self._terminal
+            namespace.update(zip(("d", "h"), args))
+            body.append("return x" if kind == "unwrap_or" else "return h(x)")
+
+        source = "def run(x):\n" + "".join(f"    {line}\n" for line in body)
+        exec(source, namespace)
+        return namespace["run"]
+
+    def _miss(self, missing: str) -> str:
+        if self._terminal is None:
+            return missing
+        kind, _ = self._terminal
+        return "d()" if kind == "map_or_else" else "d"
+
+    def _emit_map(self, _, fn):
+        return [f"x = {fn}(x)"]
+
+    def _emit_inspect(self, _, fn):
+        return [f"{fn}(x)"]
+
+
+class OptionPipeline(_Pipeline[T]):
+    """Compiled ``Option`` chain of ``map``, ``filter``, ``and_then`` and
+    ``inspect`` steps, optionally ended by ``map_or``, ``map_or_else`` or
+    ``unwrap_or``.
+
+    >>> parse = OptionPipeline().map(str.strip).filter(str.isdigit).map(int)
+    >>> parse(" 42 "), parse("x")
+    (Some(42), Nothing)
+    """
+
+    __slots__ = ()
+    _success = "Some(x)"
+
+    def filter(self, predicate: Callable[[Any], bool]) -> "OptionPipeline[T]":
+        return self._then("filter", predicate)
+
+    def apply(self, option: Any) -> Any:
+        """Run the pipeline on the value held by ``option``."""
+        if option._tag == _NOTHING_TAG:
+            return self._missed(_NOTHING)
+        return self.compile()(option.value)
+
+    def _emit_filter(self, _, predicate):
+        return [f"if not {predicate}(x):", f"    return {self._miss('NOTHING')}"]
+
+    def _emit_and_then(self, _, fn):
+        return [
+            f"x = {fn}(x)",
+            "if x._tag == NOTHING_TAG:",
+            f"    return {self._miss('NOTHING')}",
+            "x = x.value",
+        ]
+
+
+class ResultPipeline(_Pipeline[T]):
+    """Compiled ``Result`` chain of ``map``, ``and_then``, ``map_err`` and
+    ``inspect`` steps, optionally ended by ``map_or``, ``map_or_else`` or
+    ``unwrap_or``.
+
+    The first ``Err`` returned by an ``and_then`` step ends the chain, and the
+    ``map_err`` steps that follow it are applied to its error.
+    """
+
+    __slots__ = ()
+    _success = "Ok(x)"
+
+    def map_err(self, fn: Callable[[Any], Any]) -> "ResultPipeline[T]":
+        return self._then("map_err", fn)
+
+    def apply(self, result: Any) -> Any:
+        """Run the pipeline on the value held by ``result``."""
+        if result._tag != _ERR_TAG:
+            return self.compile()(result.value)
+        if self._terminal is not None:
+            return self._missed(result)
+        error = result.error
+        mappers = [args[0] for kind, args in self._steps if kind == "map_err"]
+        for mapper in mappers:
+            error = mapper(error)
+        return Err(error) if mappers else result
+
+    def _emit_map_err(self, _, fn):
+        return []
+
+    def _emit_and_then(self, index, fn):
+        mappers = [
+            f"f{i}_0"
+            for i, (kind, _) in enumerate(self._steps)
+            if i > index and kind == "map_err"
+        ]
+        error = "x.error"
+        for mapper in mappers:
+            error = f"{mapper}({error})"
+        return [
+            f"x = {fn}(x)",
+            "if x._tag == ERR_TAG:",
+            f"    return {self._miss(f'Err({error})' if mappers else 'x')}",
+            "x = x.value",
+        ]
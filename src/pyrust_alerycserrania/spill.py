@@ -0,0 +1,172 @@
+import json
+import os
+import struct
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, List, NamedTuple, Optional, Union
+
+from . import _ERR_TAG, Err, Result
+from .errors import ErrorRecord
+from .wire import PICKLE, Codec, decode, encode
+
+# length of each batch written in the wire format
+_FRAME = struct.Struct("<I")
+_SUFFIXES = {"jsonl": ".jsonl", "wire": ".pyrs"}
+
+Path = Union[str, "os.PathLike[str]"]
+
+
+def _summarize(value: Any) -> Any:
+    """Default ``default`` of the JSON lines format: exceptions are written as
+    an ``ErrorRecord``."""
+    if isinstance(value, BaseException):
+        return ErrorRecord.from_exception(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class SpillStats(NamedTuple):
+    oks: int
+    errs: int
+    files: int
+    bytes: int
+
+
+class SpillSink:
+    """Forward the ``Ok`` values of streams of results and spill their
+    ``Err`` payloads to disk.
+
+    Calling the sink with an iterable of results returns a lazy iterator of
+    the ``Ok`` values. Errors are buffered, ``buffer_size`` at most, and
+    written in batches to ``directory/<prefix>-00000.jsonl``, then
+    ``-00001``, ... once a file reaches ``max_bytes``::
+
+        with SpillSink("spill/") as sink:
+            load(sink(map(parse, records)))
+        print(sink.stats())
+        for err in sink.replay(): ...
+
+    ``file_format="jsonl"`` writes one JSON document per error, serialized
+    with ``default`` for non JSON types; by default exceptions are written as
+    an ``ErrorRecord``, and so are the errors captured with
+    ``errors.summarize()``. JSON keeps no type
+    information, so replaying gives back plain JSON values unless ``loads``
+    rebuilds them, e.g. ``loads=ErrorRecord.from_json`` when every error is
+    an ``ErrorRecord``.
+    ``file_format="wire"`` writes batches encoded by ``wire.encode`` with
+    ``codec``.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        prefix: str = "errors",
+        file_format: str = "jsonl",
+        codec: Codec = PICKLE,
+        buffer_size: int = 1024,
+        max_bytes: int = 64 * 2**20,
+        default: Callable[[Any], Any] = _summarize,
+        loads: Callable[[bytes], Any] = json.loads,
+    ):
+        if file_format not in _SUFFIXES:
+            raise ValueError(f"unknown spill format {file_format!r}")
+        self.directory = os.fspath(directory)
+        self.prefix = prefix
+        self.file_format = file_format
+        self.codec = codec
+        self.buffer_size = buffer_size
+        self.max_bytes = max_bytes
+        self.default = default
+        self.loads = loads
+        self.paths: List[str] = []
+        self.oks = 0
+        self.errs = 0
+        self.bytes = 0
+        self._buffer: List[Err] = []
+        self._file: Optional[BinaryIO] = None
+        self._size = 0
+
+    def __call__(self, results: Iterable[Result[Any, Any]]) -> Iterator[Any]:
+        buffer = self._buffer
+        for result in results:
+            if result._tag == _ERR_TAG:
+                self.errs += 1
+                buffer.append(result)
+                if len(buffer) >= self.buffer_size:
+                    self.flush()
+            else:
+                self.oks += 1
+                yield result.value
+        self.flush()
+
+    def _serialize(self, errs: List[Err]) -> bytes:
+        if self.file_format == "wire":
+            blob = encode(errs, self.codec)
+            return _FRAME.pack(len(blob)) + blob
+        dumps = json.JSONEncoder(default=self.default, separators=(",", ":")).encode
+        return "".join([dumps(err.error) + "\n" for err in errs]).encode()
+
+    def flush(self) -> None:
+        """Write the buffered errors."""
+        if not self._buffer:
+            return
+        errs = self._buffer[:]
+        # a batch that fails to serialize is dropped, not raised again by close()
+        self._buffer.clear()
+        data = self._serialize(errs)
+        if self._file is None:
+            os.makedirs(self.directory, exist_ok=True)
+            path = os.path.join(
+                self.directory,
+                f"{self.prefix}-{len(self.paths):05d}{_SUFFIXES[self.file_format]}",
+            )
+            self._file = open(path, "wb")
+            self._size = 0
+            self.paths.append(path)
+        self._file.write(data)
+        self._size += len(data)
+        self.bytes += len(data)
+        if self._size >= self.max_bytes:
+            self._file.close()
+            self._file = None
+        else:
+            self._file.flush()
+
+    def close(self) -> None:
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> "SpillSink":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def stats(self) -> SpillStats:
+        return SpillStats(self.oks, self.errs, len(self.paths), self.bytes)
+
+    def replay(self) -> Iterator[Err]:
+        """The errors spilled so far, in order."""
+        self.flush()
+        return replay(*self.paths, codec=self.codec, loads=self.loads)
+
+
+def replay(
+    *paths: Path, codec: Codec = PICKLE, loads: Callable[[bytes], Any] = json.loads
+) -> Iterator[Err]:
+    """Read back, as ``Err`` values, the errors spilled to ``paths``.
+
+    Each line of a JSON lines file is decoded by ``loads``.
+    """
+    for path in paths:
+        with open(path, "rb") as file:
+            if os.fspath(path).endswith(_SUFFIXES["wire"]):
+                while True:
+                    header = file.read(_FRAME.size)
+                    if len(header) < _FRAME.size:
+                        break
+                    (size,) = _FRAME.unpack(header)
+                    yield from decode(file.read(size), codec)
+            else:
+                for line in file:
+                    yield Err(loads(line))
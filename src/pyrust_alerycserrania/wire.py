@@ -0,0 +1,107 @@
+import json
+import pickle
+import struct
+from typing import Any, Iterable, List, Protocol, Union
+
+from . import _ERR_TAG, _NOTHING, _NOTHING_TAG, Err, Ok, Option, Result, Some
+
+# magic, version, item count
+_HEADER = struct.Struct("<4sBI")
+_MAGIC = b"PYRS"
+_VERSION = 1
+
+# indexed by variant tag; Nothing carries no payload
+_CONSTRUCTORS = (None, Some, Ok, Err)
+
+Item = Union[Option[Any], Result[Any, Any]]
+
+
+class Codec(Protocol):
+    def dumps(self, payloads: List[Any]) -> bytes:
+        ...
+
+    def loads(self, data: bytes) -> List[Any]:
+        ...
+
+
+class PickleCodec:
+    def __init__(self, protocol: int = pickle.HIGHEST_PROTOCOL):
+        self.protocol = protocol
+
+    def dumps(self, payloads: List[Any]) -> bytes:
+        return pickle.dumps(payloads, self.protocol)
+
+    def loads(self, data: bytes) -> List[Any]:
+        return pickle.loads(data)
+
+
+class JsonCodec:
+    def dumps(self, payloads: List[Any]) -> bytes:
+        return json.dumps(payloads, separators=(",", ":")).encode()
+
+    def loads(self, data: bytes) -> List[Any]:
+        return json.loads(data)
+
+
+class MsgpackCodec:
+    """Codec backed by the optional ``msgpack`` package."""
+
+    def __init__(self):
+        import msgpack
+
+        self._packb = msgpack.packb
+        self._unpackb = msgpack.unpackb
+
+    def dumps(self, payloads: List[Any]) -> bytes:
+        return self._packb(payloads)
+
+    def loads(self, data: bytes) -> List[Any]:
+        return self._unpackb(data)
+
+
+PICKLE = PickleCodec()
+JSON = JsonCodec()
+
+
+def encode(items: Iterable[Item], codec: Codec = PICKLE) -> bytes:
+    """Pack ``items`` into one buffer: a header, one tag byte per item, then
+    the payloads of every non-``Nothing`` item encoded by ``codec`` at once."""
+    tags = bytearray()
+    payloads = []
+    for item in items:
+        tag = item._tag
+        tags.append(tag)
+        if tag == _ERR_TAG:
+            payloads.append(item.error)
+        elif tag != _NOTHING_TAG:
+            payloads.append(item.value)
+    return b"".join(
+        (_HEADER.pack(_MAGIC, _VERSION, len(tags)), tags, codec.dumps(payloads))
+    )
+
+
+def decode(data: bytes, codec: Codec = PICKLE) -> List[Item]:
+    """Rebuild the list of ``Option``/``Result`` values packed by ``encode``."""
+    if len(data) < _HEADER.size:
+        raise ValueError("not a buffer produced by encode()")
+    magic, version, count = _HEADER.unpack_from(data)
+    if magic != _MAGIC or version != _VERSION:
+        raise ValueError("not a buffer produced by encode()")
+    start = _HEADER.size
+    tags = bytes(data[start : start + count])
+    payloads = codec.loads(bytes(data[start + count :]))
+    expected = count - tags.count(_NOTHING_TAG)
+    if len(tags) != count or len(payloads) != expected:
+        raise ValueError(f"buffer holds {len(payloads)} payloads for {expected} values")
+
+    if count and tags.count(tags[0]) == count:
+        # homogeneous batch: build every item without looking at its tag
+        if tags[0] == _NOTHING_TAG:
+            return [_NOTHING] * count
+        return list(map(_CONSTRUCTORS[tags[0]], payloads))
+
+    payload = iter(payloads).__next__
+    return [
+        _NOTHING if tag == _NOTHING_TAG else _CONSTRUCTORS[tag](payload())
+        for tag in tags
+    ]
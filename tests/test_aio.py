@@ -0,0 +1,191 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+
+from src.pyrust_alerycserrania import Err, Nothing, Ok, Some, as_option, as_result
+from src.pyrust_alerycserrania.aio import Stream, gather
+
+
+async def double(x: int):
+    await asyncio.sleep(0)
+    if x < 0:
+        raise ValueError(x)
+    return x * 2
+
+
+async def numbers(n: int, pulled=None):
+    for i in range(n):
+        if pulled is not None:
+            pulled.append(i)
+        yield i
+
+
+async def checked_double(x: int):
+    return Ok(await double(x)) if x >= 0 else Err(f"{x} < 0")
+
+
+class TestDecorators(IsolatedAsyncioTestCase):
+    async def test_as_result(self):
+        wrapped = as_result(double)
+        self.assertTrue(asyncio.iscoroutinefunction(wrapped))
+        self.assertEqual(await wrapped(2), Ok(4))
+        self.assertIsInstance((await wrapped(-1)).unwrap_err(), ValueError)
+
+    async def test_as_result_bases(self):
+        wrapped = as_result((TypeError,))(double)
+        with self.assertRaises(ValueError):
+            await wrapped(-1)
+
+    async def test_as_option(self):
+        @as_option
+        async def lookup(key: str):
+            await asyncio.sleep(0)
+            return {"a": 1}.get(key)
+
+        self.assertEqual(await lookup("a"), Some(1))
+        self.assertIs(await lookup("b"), Nothing())
+
+
+class TestCombinators(IsolatedAsyncioTestCase):
+    async def test_map_async(self):
+        self.assertEqual(await Ok(2).map_async(double), Ok(4))
+        self.assertEqual(await Err("e").map_async(double), Err("e"))
+
+    async def test_and_then_async(self):
+        self.assertEqual(await Ok(2).and_then_async(checked_double), Ok(4))
+        self.assertEqual(await Ok(-2).and_then_async(checked_double), Err("-2 < 0"))
+        self.assertEqual(await Err("e").and_then_async(checked_double), Err("e"))
+
+    async def test_or_else_async(self):
+        async def recover(error: str):
+            return Ok(len(error))
+
+        self.assertEqual(await Ok(2).or_else_async(recover), Ok(2))
+        self.assertEqual(await Err("abc").or_else_async(recover), Ok(3))
+
+
+class TestGather(IsolatedAsyncioTestCase):
+    async def test_gather(self):
+        results = await gather(double(1), double(-1), double(3))
+        self.assertEqual(results[0], Ok(2))
+        self.assertIsInstance(results[1].unwrap_err(), ValueError)
+        self.assertEqual(results[2], Ok(6))
+
+    async def test_gather_limit(self):
+        running = 0
+        peak = 0
+
+        async def task(x: int):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+            return x
+
+        results = await gather(*(task(x) for x in range(10)), limit=3)
+        self.assertEqual(results, [Ok(x) for x in range(10)])
+        self.assertEqual(peak, 3)
+
+    async def test_gather_bases(self):
+        with self.assertRaises(ValueError):
+            await gather(double(-1), bases=(TypeError,))
+
+
+class TestStream(IsolatedAsyncioTestCase):
+    async def test_stages(self):
+        stream = (
+            Stream(numbers(6))
+            .map(lambda x: x - 1)
+            .map(double, concurrency=3)
+            .filter(lambda x: x != 4)
+            .and_then(checked_double)
+        )
+        results = [result async for result in stream]
+        self.assertIsInstance(results[0].unwrap_err(), ValueError)
+        self.assertEqual(results[1:], [Ok(0), Ok(4), Ok(12), Ok(16)])
+
+    async def test_values_on_err(self):
+        errors = []
+        stream = Stream(numbers(5)).and_then(lambda x: checked_double(x - 2))
+        values = [value async for value in stream.values(on_err=errors.append)]
+        self.assertEqual(values, [0, 2, 4])
+        self.assertEqual(errors, [Err("-2 < 0"), Err("-1 < 0")])
+
+    async def test_async_on_err(self):
+        queue = asyncio.Queue()
+        stream = Stream(numbers(3)).map(lambda x: 1 // (x - 1))
+        values = [value async for value in stream.values(on_err=queue.put)]
+        self.assertEqual(values, [-1, 1])
+        self.assertIsInstance(queue.get_nowait().unwrap_err(), ZeroDivisionError)
+
+    async def test_unordered(self):
+        async def delayed(x: int):
+            await asyncio.sleep(0.002 * (3 - x))
+            return x
+
+        ordered = Stream(numbers(4)).map(delayed, concurrency=4)
+        self.assertEqual([r async for r in ordered], [Ok(x) for x in range(4)])
+        unordered = Stream(numbers(4)).map(delayed, concurrency=4, ordered=False)
+        self.assertEqual([r async for r in unordered], [Ok(x) for x in (3, 2, 1, 0)])
+
+    async def test_concurrency(self):
+        running = 0
+        peak = 0
+
+        async def task(x: int):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+            return x
+
+        stream = Stream(numbers(20)).map(task, concurrency=3, buffer=10)
+        self.assertEqual([r async for r in stream], [Ok(x) for x in range(20)])
+        self.assertEqual(peak, 3)
+
+    async def test_backpressure(self):
+        pulled = []
+        stream = Stream(numbers(100, pulled)).map(double, concurrency=2, buffer=4)
+        items = aiter(stream)
+        self.assertEqual(await anext(items), Ok(0))
+        await asyncio.sleep(0.01)
+        self.assertLess(len(pulled), 10)
+        await items.aclose()
+        self.assertEqual(len(asyncio.all_tasks()), 1)
+
+    async def test_close_closes_source(self):
+        closed = []
+
+        async def source():
+            try:
+                for i in range(100):
+                    yield i
+            finally:
+                closed.append(True)
+
+        for stream in (Stream(source()), Stream(source()).map(double, concurrency=2)):
+            items = aiter(stream)
+            await anext(items)
+            await items.aclose()
+        self.assertEqual(closed, [True, True])
+
+    async def test_bases(self):
+        stream = Stream(numbers(3)).map(lambda x: double(-x), bases=(TypeError,))
+        with self.assertRaises(ValueError):
+            [result async for result in stream]
+
+    async def test_source_error(self):
+        async def broken():
+            yield 1
+            raise ConnectionError()
+
+        stream = Stream(broken()).map(double)
+        items = aiter(stream)
+        self.assertEqual(await anext(items), Ok(2))
+        with self.assertRaises(ConnectionError):
+            await anext(items)
+
+    def test_concurrency_check(self):
+        with self.assertRaises(ValueError):
+            Stream(numbers(1)).map(double, concurrency=0)
@@ -0,0 +1,87 @@
+from unittest import TestCase
+
+from src.pyrust_alerycserrania import Err, Nothing, Ok, Some
+from src.pyrust_alerycserrania.arrays import OptionArray, ResultArray
+
+
+class TestOptionArray(TestCase):
+    def setUp(self):
+        self.options = [Some(1), Nothing(), Some(3), Some(None), Nothing()]
+        self.array = OptionArray.from_options(self.options)
+
+    def test_round_trip(self):
+        self.assertEqual(len(self.array), 5)
+        self.assertEqual(self.array.to_list(), self.options)
+        self.assertEqual(list(self.array), self.options)
+        self.assertEqual(self.array[2], Some(3))
+        self.assertIs(self.array[-1], Nothing())
+        self.assertEqual(self.array[1:3].to_list(), [Nothing(), Some(3)])
+        self.assertEqual(OptionArray.from_options(self.array), self.array)
+
+    def test_from_values(self):
+        array = OptionArray.from_values([1, None, 3])
+        self.assertEqual(array.to_list(), [Some(1), Nothing(), Some(3)])
+
+    def test_count_and_values(self):
+        self.assertEqual(self.array.count(), 3)
+        self.assertEqual(self.array.values(), [1, 3, None])
+
+    def test_map(self):
+        seen = []
+        mapped = self.array.map(lambda x: seen.append(x) or str(x))
+        self.assertEqual(mapped.to_list(), [o.map(str) for o in self.options])
+        self.assertEqual(seen, [1, 3, None])
+
+    def test_filter(self):
+        filtered = self.array.filter(lambda x: x != 3)
+        self.assertEqual(
+            filtered.to_list(), [o.filter(lambda x: x != 3) for o in self.options]
+        )
+
+    def test_unwrap_or(self):
+        self.assertEqual(self.array.unwrap_or(0), [1, 0, 3, None, 0])
+        self.assertEqual(OptionArray.from_values([1, 2]).unwrap_or(0), [1, 2])
+
+    def test_ok_or(self):
+        self.assertEqual(
+            self.array.ok_or("missing").to_list(),
+            [o.ok_or("missing") for o in self.options],
+        )
+
+    def test_mismatched_lengths(self):
+        self.assertRaises(ValueError, OptionArray, [1, 2], bytearray(b"\x01"))
+
+
+class TestResultArray(TestCase):
+    def setUp(self):
+        self.results = [Ok(1), Err("a"), Ok(3), Err("b")]
+        self.array = ResultArray.from_results(self.results)
+
+    def test_round_trip(self):
+        self.assertEqual(self.array.to_list(), self.results)
+        self.assertEqual(self.array[1], Err("a"))
+        self.assertEqual(self.array[::2].to_list(), [Ok(1), Ok(3)])
+
+    def test_counts(self):
+        self.assertEqual(self.array.count_ok(), 2)
+        self.assertEqual(self.array.count_err(), 2)
+
+    def test_partition(self):
+        self.assertEqual(self.array.partition(), ([1, 3], ["a", "b"]))
+
+    def test_ok_err(self):
+        self.assertEqual(self.array.ok().to_list(), [r.ok() for r in self.results])
+        self.assertEqual(self.array.err().to_list(), [r.err() for r in self.results])
+
+    def test_map(self):
+        self.assertEqual(
+            self.array.map(lambda x: x * 2).to_list(),
+            [Ok(2), Err("a"), Ok(6), Err("b")],
+        )
+        self.assertEqual(
+            self.array.map_err(str.upper).to_list(),
+            [Ok(1), Err("A"), Ok(3), Err("B")],
+        )
+
+    def test_unwrap_or(self):
+        self.assertEqual(self.array.unwrap_or(0), [1, 0, 3, 0])
@@ -0,0 +1,182 @@
+import asyncio
+import threading
+import time
+from unittest import TestCase
+
+from src.pyrust_alerycserrania import Nothing, Ok, Some, as_option, as_result
+from src.pyrust_alerycserrania.cache import CacheInfo, cached
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCached(TestCase):
+    def test_caches_ok(self):
+        calls = []
+
+        @cached
+        @as_result
+        def parse(text: str):
+            calls.append(text)
+            return int(text)
+
+        self.assertEqual(parse("1"), Ok(1))
+        self.assertEqual(parse("1"), Ok(1))
+        self.assertEqual(calls, ["1"])
+        self.assertEqual(parse.cache_info(), CacheInfo(1, 0, 1, 0, 1, 0))
+
+    def test_err_not_cached_by_default(self):
+        calls = []
+
+        @cached
+        @as_result
+        def parse(text: str):
+            calls.append(text)
+            return int(text)
+
+        parse("x")
+        parse("x")
+        self.assertEqual(calls, ["x", "x"])
+        self.assertEqual(parse.cache_info().currsize, 0)
+
+    def test_negative_ttl(self):
+        clock = Clock()
+        calls = []
+        table = {}
+
+        @cached(negative_ttl=5, timer=clock)
+        @as_option
+        def lookup(key: str):
+            calls.append(key)
+            return table.get(key)
+
+        self.assertIs(lookup("a"), Nothing())
+        self.assertIs(lookup("a"), Nothing())
+        self.assertEqual(calls, ["a"])
+        table["a"] = 1
+        clock.now = 5
+        self.assertEqual(lookup("a"), Some(1))
+        self.assertEqual(lookup("a"), Some(1))
+        self.assertEqual(calls, ["a", "a"])
+        info = lookup.cache_info()
+        self.assertEqual((info.hits, info.negative_hits, info.misses), (1, 1, 2))
+
+    def test_ttl(self):
+        clock = Clock()
+        calls = []
+
+        @cached(ttl=10, timer=clock)
+        def square(x: int):
+            calls.append(x)
+            return Ok(x * x)
+
+        square(3)
+        clock.now = 9.9
+        square(3)
+        clock.now = 10
+        square(3)
+        self.assertEqual(calls, [3, 3])
+
+    def test_lru_eviction(self):
+        @cached(maxsize=2)
+        def identity(x: int):
+            return Ok(x)
+
+        identity(1)
+        identity(2)
+        identity(1)
+        identity(3)
+        self.assertEqual(identity.cache_info().evictions, 1)
+        identity(1)
+        self.assertEqual(identity.cache_info().hits, 2)
+        identity(2)
+        self.assertEqual(identity.cache_info().misses, 4)
+
+    def test_kwargs_key(self):
+        @cached
+        def add(x: int, y: int = 0):
+            return Ok(x + y)
+
+        self.assertEqual(add(1, y=2), Ok(3))
+        self.assertEqual(add(1, y=3), Ok(4))
+        self.assertEqual(add(1), Ok(1))
+        self.assertEqual(add.cache_info().currsize, 3)
+
+    def test_single_flight(self):
+        calls = []
+        started = threading.Event()
+
+        @cached
+        def slow(x: int):
+            calls.append(x)
+            started.set()
+            time.sleep(0.05)
+            return Ok(x)
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(slow(1))) for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(calls, [1])
+        self.assertEqual(results, [Ok(1)] * 5)
+
+    def test_exception_propagates(self):
+        @cached
+        def boom():
+            raise KeyError("k")
+
+        self.assertRaises(KeyError, boom)
+        self.assertRaises(KeyError, boom)
+        self.assertEqual(boom.cache_info().misses, 2)
+
+    def test_cache_clear(self):
+        @cached
+        def identity(x: int):
+            return Ok(x)
+
+        identity(1)
+        identity(1)
+        identity.cache_clear()
+        self.assertEqual(identity.cache_info(), CacheInfo(0, 0, 0, 0, 0, 0))
+
+    def test_coroutine_function(self):
+        calls = []
+
+        @cached
+        @as_result
+        async def fetch(x: int):
+            calls.append(x)
+            await asyncio.sleep(0.01)
+            return x * 2
+
+        async def main():
+            first = await fetch(1)
+            again = await fetch(1)
+            together = await asyncio.gather(*(fetch(2) for _ in range(5)))
+            return first, again, together
+
+        first, again, together = asyncio.run(main())
+        self.assertEqual((first, again), (Ok(2), Ok(2)))
+        self.assertEqual(together, [Ok(4)] * 5)
+        self.assertEqual(calls, [1, 2])
+        self.assertEqual(fetch.cache_info().hits, 1)
+
+    def test_coroutine_exception_propagates(self):
+        @cached
+        async def boom():
+            raise KeyError("k")
+
+        async def main():
+            return await asyncio.gather(boom(), boom(), return_exceptions=True)
+
+        errors = asyncio.run(main())
+        self.assertEqual([type(error) for error in errors], [KeyError, KeyError])
@@ -0,0 +1,79 @@
+import gc
+import pickle
+import weakref
+from unittest import TestCase
+
+from src.pyrust_alerycserrania import Ok, as_result
+from src.pyrust_alerycserrania.errors import ErrorRecord, strip_traceback, summarize
+
+
+class Payload:
+    pass
+
+
+def fail(payloads):
+    local = Payload()
+    payloads.append(weakref.ref(local))
+    raise KeyError("missing")
+
+
+class TestErrors(TestCase):
+    def test_as_result_keeps_frames(self):
+        payloads = []
+        result = as_result(fail)(payloads)
+        gc.collect()
+        self.assertIsNotNone(payloads[0]())
+        del result
+
+    def test_strip_traceback(self):
+        payloads = []
+        result = as_result((KeyError,), capture=strip_traceback)(fail)(payloads)
+        gc.collect()
+        self.assertIsNone(payloads[0]())
+        self.assertIsInstance(result.unwrap_err(), KeyError)
+        self.assertIsNone(result.unwrap_err().__traceback__)
+
+    def test_strip_chained(self):
+        try:
+            try:
+                raise ValueError("inner")
+            except ValueError as inner:
+                raise KeyError("outer") from inner
+        except KeyError as exc:
+            stripped = strip_traceback(exc)
+        self.assertIsNone(stripped.__traceback__)
+        self.assertIsNone(stripped.__cause__.__traceback__)
+
+    def test_summarize(self):
+        payloads = []
+        capture = summarize(frames=1)
+        result = as_result((Exception,), capture=capture)(fail)(payloads)
+        gc.collect()
+        self.assertIsNone(payloads[0]())
+        record = result.unwrap_err()
+        self.assertEqual(record.type, "KeyError")
+        self.assertEqual(record.message, "'missing'")
+        self.assertEqual(len(record.frames), 1)
+        self.assertIn("in fail", record.frames[0])
+        self.assertEqual(pickle.loads(pickle.dumps(record)), record)
+
+    def test_summarize_codes(self):
+        capture = summarize(codes={LookupError: "E_LOOKUP", ValueError: 2})
+
+        @as_result((Exception,), capture=capture)
+        def parse(mapping, key):
+            return int(mapping[key])
+
+        self.assertEqual(parse({"a": "1"}, "a"), Ok(1))
+        self.assertEqual(parse({}, "a").unwrap_err(), "E_LOOKUP")
+        self.assertEqual(parse([], 0).unwrap_err(), "E_LOOKUP")
+        self.assertEqual(parse({"a": "x"}, "a").unwrap_err(), 2)
+        record = parse(None, "a").unwrap_err()
+        self.assertEqual(record, ErrorRecord("TypeError", record.message))
+
+    def test_record_type_name(self):
+        class Custom(Exception):
+            pass
+
+        record = ErrorRecord.from_exception(Custom("x"))
+        self.assertEqual(record.type, f"{__name__}.{Custom.__qualname__}")
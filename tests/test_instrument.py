@@ -0,0 +1,103 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+import src.pyrust_alerycserrania.instrument as instrument
+from src.pyrust_alerycserrania import Err, Nothing, Ok, Panic, as_option, as_result
+
+
+def parse(text: str):
+    return int(text)
+
+
+class TestHooks(TestCase):
+    def test_err_hook(self):
+        seen = []
+        instrument.add_err_hook(seen.append)
+        try:
+            err = Err("e")
+            as_result(parse)("x")
+            Ok(1)
+        finally:
+            instrument.remove_err_hook(seen.append)
+        Err("after")
+        self.assertEqual(len(seen), 2)
+        self.assertIs(seen[0], err)
+        self.assertIsInstance(seen[1].error, ValueError)
+
+    def test_panic_hook(self):
+        seen = []
+        instrument.add_panic_hook(seen.append)
+        try:
+            with self.assertRaises(Panic):
+                Err("e").expect("boom")
+        finally:
+            instrument.remove_panic_hook(seen.append)
+        self.assertEqual([str(panic) for panic in seen], ["boom"])
+
+
+class TestInstrumented(TestCase):
+    def setUp(self):
+        instrument.enable()
+
+    def tearDown(self):
+        instrument.disable()
+
+    def test_disabled_returns_function(self):
+        instrument.disable()
+        wrapped = as_result(parse)
+        self.assertIs(instrument.instrumented(wrapped), wrapped)
+
+    def test_stats(self):
+        failures = []
+
+        @instrument.instrumented(on_failure=failures.append, sample_rate=1.0)
+        @as_result
+        def checked_parse(text: str):
+            return int(text)
+
+        for text in ["1", "2", "x", "3"]:
+            checked_parse(text)
+
+        stats = checked_parse.stats
+        self.assertEqual(stats.calls, 4)
+        self.assertEqual(stats.failures, 1)
+        self.assertEqual(stats.failure_rate, 0.25)
+        self.assertEqual(stats.error_types, {"ValueError": 1})
+        self.assertEqual(sum(stats.latency), 4)
+        self.assertGreater(stats.percentile(0.99), 0)
+        self.assertEqual(len(failures), 1)
+        self.assertEqual(len(stats.samples), 1)
+        self.assertIn(__file__, stats.samples[0])
+        self.assertIn("in test_stats", stats.samples[0])
+        self.assertIs(instrument.stats()[stats.name], stats)
+
+    def test_options(self):
+        @instrument.instrumented
+        @as_option
+        def lookup(key: str):
+            return {"a": 1}.get(key)
+
+        lookup("a")
+        self.assertIs(lookup("b"), Nothing())
+        self.assertEqual(lookup.stats.error_types, {"Nothing": 1})
+        self.assertEqual(len(lookup.stats.samples), 0)
+
+
+class TestInstrumentedAsync(IsolatedAsyncioTestCase):
+    async def test_async(self):
+        instrument.enable()
+        try:
+
+            @instrument.instrumented
+            @as_result
+            async def fetch(x: int):
+                await asyncio.sleep(0)
+                return 1 // x
+
+        finally:
+            instrument.disable()
+
+        self.assertEqual(await fetch(1), Ok(1))
+        await fetch(0)
+        self.assertEqual(fetch.stats.calls, 2)
+        self.assertEqual(fetch.stats.error_types, {"ZeroDivisionError": 1})
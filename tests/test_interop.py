@@ -0,0 +1,93 @@
+import sys
+from unittest import TestCase, skipUnless
+
+from src.pyrust_alerycserrania import Err, Nothing, Ok, Some
+from src.pyrust_alerycserrania.arrays import OptionArray, ResultArray
+from src.pyrust_alerycserrania.interop import (
+    map_values,
+    options_from_masked,
+    options_from_nullable,
+    results_from_masked,
+    results_from_nullable,
+    to_masked,
+    to_nullable,
+    unwrap_or,
+)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+
+class TestLazyImport(TestCase):
+    def test_not_imported(self):
+        module = sys.modules["src.pyrust_alerycserrania.interop"]
+        self.assertNotIn("numpy", vars(module))
+        self.assertNotIn("pandas", vars(module))
+
+
+@skipUnless(numpy, "numpy is not installed")
+class TestMasked(TestCase):
+    def test_to_masked(self):
+        array = to_masked([Some(1), Nothing(), Some(3)])
+        self.assertEqual(array.dtype, numpy.int64)
+        self.assertEqual(array.tolist(), [1, None, 3])
+        self.assertEqual(to_masked([Ok(1.5), Err("e")]).tolist(), [1.5, None])
+        self.assertEqual(to_masked([Nothing()]).tolist(), [None])
+
+    def test_to_masked_from_arrays(self):
+        options = OptionArray.from_values([1, None])
+        results = ResultArray.from_results([Ok(1), Err("e")])
+        self.assertEqual(to_masked(options, dtype=float).tolist(), [1.0, None])
+        self.assertEqual(to_masked(results).tolist(), [1, None])
+
+    def test_from_masked(self):
+        array = numpy.ma.MaskedArray([1, 2, 3], mask=[False, True, False])
+        self.assertEqual(
+            options_from_masked(array).to_list(), [Some(1), Nothing(), Some(3)]
+        )
+        self.assertEqual(
+            results_from_masked(array, "missing").to_list(),
+            [Ok(1), Err("missing"), Ok(3)],
+        )
+        self.assertEqual(
+            options_from_masked(numpy.array([1, 2])).to_list(), [Some(1), Some(2)]
+        )
+
+    def test_map_unwrap_or(self):
+        array = to_masked([Some(4), Nothing(), Some(9)])
+        self.assertEqual(map_values(numpy.sqrt, array).tolist(), [2.0, None, 3.0])
+        self.assertEqual(unwrap_or(array, 0).tolist(), [4, 0, 9])
+
+
+@skipUnless(pandas, "pandas is not installed")
+class TestNullable(TestCase):
+    def test_to_nullable(self):
+        array = to_nullable([Some(1), Nothing(), Ok(3), Err("e")])
+        self.assertEqual(str(array.dtype), "Int64")
+        self.assertEqual(array.isna().tolist(), [False, True, False, True])
+        self.assertEqual(
+            str(to_nullable([Some("a"), Nothing()], dtype="string").dtype), "string"
+        )
+
+    def test_from_nullable(self):
+        array = pandas.array([1, None, 3], dtype="Int64")
+        self.assertEqual(
+            options_from_nullable(array).to_list(), [Some(1), Nothing(), Some(3)]
+        )
+        self.assertEqual(
+            results_from_nullable(pandas.Series(array), "e").to_list(),
+            [Ok(1), Err("e"), Ok(3)],
+        )
+
+    def test_map_unwrap_or(self):
+        array = pandas.array([4, None, 9], dtype="Int64")
+        mapped = map_values(numpy.sqrt, array)
+        self.assertEqual(mapped.isna().tolist(), [False, True, False])
+        self.assertEqual(unwrap_or(array, 0).tolist(), [4, 0, 9])
@@ -0,0 +1,104 @@
+from unittest import TestCase
+
+from src.pyrust_alerycserrania import Err, Nothing, Ok, Some
+from src.pyrust_alerycserrania.iterators import (
+    collect_options,
+    collect_results,
+    err_values,
+    filter_map,
+    flatten,
+    fold_options,
+    fold_results,
+    ok_values,
+    partition,
+    sum_options,
+    sum_results,
+    unwrap_or_default,
+)
+
+
+def tracked(items, consumed):
+    for item in items:
+        consumed.append(item)
+        yield item
+
+
+class TestIterators(TestCase):
+    def test_collect_results(self):
+        self.assertEqual(collect_results(Ok(x) for x in range(3)), Ok([0, 1, 2]))
+        self.assertEqual(collect_results([]), Ok([]))
+
+        consumed = []
+        results = tracked([Ok(1), Err("a"), Ok(2), Err("b")], consumed)
+        self.assertEqual(collect_results(results), Err("a"))
+        self.assertEqual(consumed, [Ok(1), Err("a")])
+
+    def test_collect_options(self):
+        self.assertEqual(collect_options(Some(x) for x in range(3)), Some([0, 1, 2]))
+
+        consumed = []
+        options = tracked([Some(1), Nothing(), Some(2)], consumed)
+        self.assertIs(collect_options(options), Nothing())
+        self.assertEqual(consumed, [Some(1), Nothing()])
+
+    def test_fold(self):
+        self.assertEqual(
+            fold_results([Ok("a"), Ok("b")], "", lambda acc, x: acc + x), Ok("ab")
+        )
+        self.assertEqual(
+            fold_results([Ok("a"), Err(1), Err(2)], "", lambda acc, x: acc + x),
+            Err(1),
+        )
+        self.assertEqual(fold_options([Some(2), Some(3)], 1, int.__mul__), Some(6))
+        self.assertIs(fold_options([Some(2), Nothing()], 1, int.__mul__), Nothing())
+
+    def test_sum(self):
+        self.assertEqual(sum_results(Ok(x) for x in range(5)), Ok(10))
+        self.assertEqual(sum_results([Ok(1), Err("a")]), Err("a"))
+        self.assertEqual(sum_options([Some(1.5), Some(2)], 0.5), Some(4.0))
+        self.assertIs(sum_options([Nothing(), Some(1)]), Nothing())
+
+    def test_partition(self):
+        results = [Ok(1), Err("a"), Ok(2), Ok(3), Err("b")]
+        oks, errs = partition(iter(results))
+        self.assertEqual(list(oks), [1, 2, 3])
+        self.assertEqual(list(errs), ["a", "b"])
+
+    def test_partition_is_lazy(self):
+        consumed = []
+        oks, errs = partition(tracked([Ok(1), Err("a"), Ok(2), Err("b")], consumed))
+        self.assertEqual(consumed, [])
+        self.assertEqual(next(oks), 1)
+        self.assertEqual(consumed, [Ok(1)])
+        self.assertEqual(next(errs), "a")
+        self.assertEqual(next(oks), 2)
+        self.assertEqual(len(consumed), 3)
+        self.assertEqual(list(errs), ["b"])
+        self.assertEqual(list(oks), [])
+
+    def test_iter(self):
+        self.assertEqual(list(Some(1)), [1])
+        self.assertEqual(list(Nothing()), [])
+        self.assertEqual(list(Ok(1)), [1])
+        self.assertEqual(list(Err(1)), [])
+
+    def test_flatten(self):
+        items = [Some(1), Nothing(), Ok(2), Err(3), Some(None)]
+        self.assertEqual(list(flatten(items)), [1, 2, None])
+        self.assertEqual(list(flatten([])), [])
+
+    def test_filter_map(self):
+        def parse(s):
+            return Ok(int(s)) if s.isdigit() else Err(s)
+
+        self.assertEqual(list(filter_map(parse, ["1", "x", "3"])), [1, 3])
+
+    def test_ok_err_values(self):
+        results = [Ok(1), Err("a"), Ok(2), Err("b")]
+        self.assertEqual(list(ok_values(results)), [1, 2])
+        self.assertEqual(list(err_values(results)), ["a", "b"])
+
+    def test_unwrap_or_default(self):
+        items = [Some(1), Nothing(), Ok(2), Err(3)]
+        self.assertEqual(list(unwrap_or_default(items)), [1, None, 2, None])
+        self.assertEqual(list(unwrap_or_default(items, 0)), [1, 0, 2, 0])
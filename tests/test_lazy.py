@@ -0,0 +1,145 @@
+import pickle
+import threading
+import time
+from unittest import TestCase
+
+from src.pyrust_alerycserrania import Err, Handlers, Nothing, Ok, Option, Result, Some
+from src.pyrust_alerycserrania.iterators import collect_options, fold_options
+from src.pyrust_alerycserrania.lazy import LazyOption, LazyResult
+from src.pyrust_alerycserrania.pipeline import OptionPipeline
+
+
+def counting(value, calls):
+    def thunk():
+        calls.append(value)
+        return value
+
+    return thunk
+
+
+class TestLazyOption(TestCase):
+    def test_not_evaluated_until_inspected(self):
+        calls = []
+        option = LazyOption(counting(Some(2), calls))
+        mapped = option.map(lambda x: x * 10).filter(bool)
+        self.assertEqual(calls, [])
+        self.assertFalse(option.is_forced())
+        self.assertEqual(repr(mapped), "LazyOption(<pending>)")
+
+        self.assertEqual(mapped.unwrap(), 20)
+        self.assertEqual(option.unwrap_or(0), 2)
+        self.assertEqual(calls, [Some(2)])
+        self.assertEqual(repr(option), "LazyOption(Some(2))")
+
+    def test_plugs_into_combinators(self):
+        some = LazyOption(lambda: Some(2))
+        nothing = LazyOption(lambda: Nothing())
+        self.assertIsInstance(some, Option)
+        self.assertEqual(some, Some(2))
+        self.assertEqual(Some(2), some)
+        self.assertEqual(Nothing(), nothing)
+        self.assertNotEqual(some, nothing)
+        self.assertEqual(Some(1).and_(some), Some(2))
+        self.assertEqual(Some(1).xor(nothing), Some(1))
+        self.assertEqual(nothing.or_(some), Some(2))
+        self.assertEqual(some.ok_or("e"), Ok(2))
+        self.assertIsInstance(some.ok_or("e"), LazyResult)
+        self.assertEqual(list(some), [2])
+        self.assertEqual(
+            sorted([some, Some(1), nothing]), [Nothing(), Some(1), Some(2)]
+        )
+        self.assertEqual(hash(some), hash(Some(2)))
+        self.assertEqual(nothing.fold(str, lambda: "-"), "-")
+        self.assertEqual(Handlers(on_some=str)(some), "2")
+
+    def test_transpose(self):
+        self.assertIs(Ok(LazyOption(lambda: Nothing())).transpose(), Nothing())
+        self.assertEqual(Ok(LazyOption(lambda: Some(1))).transpose(), Some(Ok(1)))
+
+    def test_collect_and_fold(self):
+        nothing = LazyOption(lambda: Nothing())
+        some = LazyOption(lambda: Some(2))
+        self.assertIs(collect_options([Some(1), nothing]), Nothing())
+        self.assertEqual(collect_options([Some(1), some]), Some([1, 2]))
+        self.assertIs(fold_options([Some(1), nothing], 0, max), Nothing())
+        self.assertEqual(fold_options([Some(1), some], 0, max), Some(2))
+
+    def test_pipeline(self):
+        nothing = LazyOption(lambda: Nothing())
+        self.assertIs(OptionPipeline().map(str).apply(nothing), Nothing())
+        self.assertEqual(
+            OptionPipeline().map(str).apply(LazyOption(lambda: Some(1))), Some("1")
+        )
+        pipeline = OptionPipeline().and_then(lambda _: nothing).map(str)
+        self.assertIs(pipeline(1), Nothing())
+
+    def test_thunk_must_return_an_option(self):
+        calls = []
+        option = LazyOption(counting(None, calls))
+        with self.assertRaises(TypeError):
+            option.is_some()
+        with self.assertRaises(TypeError):
+            option.is_some()
+        self.assertEqual(calls, [None, None])
+        self.assertFalse(option.is_forced())
+
+    def test_pickle(self):
+        option = LazyOption(lambda: Some(2))
+        self.assertEqual(pickle.loads(pickle.dumps(option)), Some(2))
+
+    def test_immutable(self):
+        with self.assertRaises(AttributeError):
+            LazyOption(lambda: Some(2))._forced = Nothing()
+
+    def test_runs_once_across_threads(self):
+        calls = []
+
+        def slow():
+            calls.append(1)
+            time.sleep(0.01)
+            return Some(len(calls))
+
+        option = LazyOption(slow)
+        threads = [threading.Thread(target=option.unwrap) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(calls, [1])
+        self.assertEqual(option, Some(1))
+
+    def test_retries_after_exception(self):
+        attempts = []
+
+        def flaky():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise ConnectionError()
+            return Some("ok")
+
+        option = LazyOption(flaky)
+        with self.assertRaises(ConnectionError):
+            option.unwrap()
+        self.assertEqual(option.unwrap(), "ok")
+        self.assertEqual(len(attempts), 2)
+
+
+class TestLazyResult(TestCase):
+    def test_combinators(self):
+        calls = []
+        result = LazyResult(counting(Err("aie"), calls))
+        recovered = result.map(len).or_else(lambda e: Ok(e.upper()))
+        self.assertIsInstance(result, Result)
+        self.assertEqual(calls, [])
+        self.assertEqual(recovered, Ok("AIE"))
+        self.assertEqual(result.error, "aie")
+        self.assertEqual(result.err(), Some("aie"))
+        self.assertIs(result.ok().force(), Nothing())
+        self.assertEqual(result.unwrap_or_else(len), 3)
+        self.assertEqual(calls, [Err("aie")])
+
+    def test_and_then(self):
+        result = LazyResult(lambda: Ok(4)).and_then(lambda x: Ok(x // 2))
+        self.assertIsInstance(result, LazyResult)
+        self.assertEqual(result, Ok(2))
+        self.assertEqual(result.value, 2)
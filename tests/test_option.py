@@ -1,6 +1,19 @@
+import copy
+import pickle
+import weakref
 from unittest import TestCase
 
-from src.pyrust_alerycserrania import Err, Nothing, Ok, Panic, Some, as_option
+from src.pyrust_alerycserrania import (
+    Err,
+    Handlers,
+    Nothing,
+    Ok,
+    Panic,
+    Some,
+    as_option,
+    result_block,
+    sort_key,
+)
 
 
 class TestOption(TestCase):
@@ -12,6 +25,29 @@ class TestOption(TestCase):
         self.assertFalse(Some(""))
         self.assertFalse(Nothing())
 
+    def test_slots(self):
+        self.assertFalse(hasattr(Some(5), "__dict__"))
+        self.assertFalse(hasattr(Nothing(), "__dict__"))
+        self.assertRaises(TypeError, weakref.ref, Some(5))
+
+        class WeakSome(Some):
+            __slots__ = ("__weakref__",)
+
+        some = WeakSome(5)
+        self.assertIs(weakref.ref(some)(), some)
+        self.assertEqual(some, Some(5))
+
+    def test_nothing_singleton(self):
+        self.assertIs(Nothing(), Nothing())
+        self.assertIs(pickle.loads(pickle.dumps(Nothing())), Nothing())
+        self.assertIs(copy.copy(Nothing()), Nothing())
+        self.assertIs(copy.deepcopy([Nothing()])[0], Nothing())
+        self.assertIs(Some(5).filter(lambda x: x < 0), Nothing())
+        self.assertIs(Some(5).xor(Some(4)), Nothing())
+        self.assertIs(Ok(5).err(), Nothing())
+        self.assertIs(Err(5).ok(), Nothing())
+        self.assertIs(as_option(None), Nothing())
+
     def test_eq(self):
         self.assertTrue(Some(4) == Some(4))
         self.assertFalse(Some(4) == Some(5))
@@ -28,6 +64,13 @@ class TestOption(TestCase):
         self.assertTrue(Nothing() != Some(5))
         self.assertTrue(Some(5) != Nothing())
 
+    def test_hash(self):
+        self.assertEqual(hash(Some(4)), hash(Some(4)))
+        self.assertEqual(hash(Nothing()), hash(Nothing()))
+        self.assertEqual(len({Some(4), Some(4), Nothing(), Nothing()}), 2)
+        self.assertEqual({Some(4): "some", Nothing(): "nothing"}[Nothing()], "nothing")
+        self.assertRaises(TypeError, hash, Some([4]))
+
     def test_lt(self):
         self.assertTrue(Some(4) < Some(5))
         self.assertFalse(Some(4) < Some(4))
@@ -64,6 +107,14 @@ class TestOption(TestCase):
         self.assertFalse(Nothing() >= Some(4))
         self.assertTrue(Nothing() >= Nothing())
 
+    def test_sort_key(self):
+        options = [Some(3), Nothing(), Some(1), Nothing(), Some(2)]
+        expected = [Nothing(), Nothing(), Some(1), Some(2), Some(3)]
+        self.assertEqual(sorted(options), expected)
+        self.assertEqual(sorted(options, key=sort_key), expected)
+        self.assertEqual(min(options, key=sort_key), Nothing())
+        self.assertEqual(max(options, key=sort_key), Some(3))
+
     def test_is_some(self):
         self.assertTrue(Some(2).is_some())
         self.assertFalse(Nothing().is_some())
@@ -82,6 +133,14 @@ class TestOption(TestCase):
         with self.assertRaises(Panic, msg="expected value"):
             Nothing().expect("expected value")
 
+    def test_expect_lazy_message(self):
+        self.assertEqual(Some(1).expect(lambda: self.fail("formatted")), 1)
+        with self.assertRaises(Panic) as raised:
+            Nothing().expect("no user %r", "u-1")
+        self.assertEqual(str(raised.exception), "no user 'u-1'")
+        self.assertIs(raised.exception.variant, Nothing())
+        self.assertIsNone(raised.exception.payload)
+
     def test_unwrap(self):
         self.assertEqual(Some("value").unwrap(), "value")
         self.assertRaises(Panic, Nothing().unwrap)
@@ -101,6 +160,20 @@ class TestOption(TestCase):
         )
         self.assertEqual(Nothing().map(lambda x: x.split()), Nothing())
 
+    def test_immutable(self):
+        some = Some(2)
+        with self.assertRaises(AttributeError):
+            some.value = 3
+        with self.assertRaises(AttributeError):
+            Nothing().value = 3
+        self.assertEqual(some, Some(2))
+
+    def test_map_in_place(self):
+        some = Some(2)
+        self.assertIs(some.map_in_place(lambda x: x * 2), some)
+        self.assertEqual(some, Some(4))
+        self.assertIs(Nothing().map_in_place(lambda x: x * 2), Nothing())
+
     def test_inspect(self):
         self.assertEqual(Some(4).inspect(lambda v: self.assertEqual(v, 4)), Some(4))
         self.assertEqual(
@@ -157,6 +230,11 @@ class TestOption(TestCase):
         self.assertEqual(Some(2).ok_or_else(lambda: "error"), Ok(2))
         self.assertEqual(Nothing().ok_or_else(lambda: "error"), Err("error"))
 
+    def test_transpose(self):
+        self.assertEqual(Some(Ok(5)).transpose(), Ok(Some(5)))
+        self.assertEqual(Some(Err("aie")).transpose(), Err("aie"))
+        self.assertEqual(Nothing().transpose(), Ok(Nothing()))
+
     def test_as_option(self):
         @as_option
         def my_func(x: int):
@@ -167,3 +245,52 @@ class TestOption(TestCase):
 
         self.assertEqual(as_option(5), Some(5))
         self.assertEqual(as_option(None), Nothing())
+
+    def test_fold(self):
+        self.assertEqual(Some(2).fold(lambda x: x * 10, lambda: 0), 20)
+        self.assertEqual(Nothing().fold(lambda x: x * 10, lambda: 0), 0)
+
+    def test_fold_with(self):
+        handlers = Handlers(on_nothing=lambda: "-", on_some=str, on_ok=repr)
+        self.assertEqual(Some(1).fold_with(handlers), "1")
+        self.assertEqual(Nothing().fold_with(handlers), "-")
+        self.assertEqual(
+            list(map(handlers, [Some(1), Nothing(), Ok("a")])), ["1", "-", "'a'"]
+        )
+
+    def test_result_block(self):
+        @result_block
+        def add(a, b):
+            return Some(a.q() + b.q())
+
+        self.assertEqual(add(Some(1), Some(2)), Some(3))
+        self.assertIs(add(Some(1), Nothing()), Nothing())
+
+    def test_result_block_releases_frames(self):
+        from src.pyrust_alerycserrania import _NOTHING_RETURN
+
+        try:
+            raise KeyError("k")
+        except KeyError:
+            self.assertIs(result_block(Nothing.q)(Nothing()), Nothing())
+        self.assertIsNone(_NOTHING_RETURN.__traceback__)
+        self.assertIsNone(_NOTHING_RETURN.__context__)
+
+    def test_as_option_registered_types(self):
+        class Missing:
+            pass
+
+        @as_option
+        def identity(x):
+            return x
+
+        missing = Missing()
+        self.assertEqual(identity(missing), Some(missing))
+
+        @as_option.register(Missing)
+        def _(_: Missing):
+            return Nothing()
+
+        self.assertIs(identity(missing), Nothing())
+        self.assertIs(identity(None), Nothing())
+        self.assertEqual(identity("a"), Some("a"))
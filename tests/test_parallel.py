@@ -0,0 +1,78 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from src.pyrust_alerycserrania import Ok
+from src.pyrust_alerycserrania.parallel import RemoteError, try_map
+
+
+class Unpicklable(Exception):
+    def __reduce__(self):
+        raise TypeError("cannot pickle")
+
+
+def parse(text: str):
+    return int(text)
+
+
+def fail_unpicklable(_):
+    raise Unpicklable("boom")
+
+
+def slow_identity(x: int):
+    time.sleep(x / 100)
+    return x
+
+
+class TestTryMap(TestCase):
+    def test_threads(self):
+        results = list(try_map(parse, ["1", "x", "3"], 2))
+        self.assertEqual(results[0], Ok(1))
+        self.assertIsInstance(results[1].unwrap_err(), ValueError)
+        self.assertEqual(results[2], Ok(3))
+
+    def test_processes(self):
+        items = [str(x) if x % 5 else "bad" for x in range(100)]
+        results = list(try_map(parse, items, 2, processes=True))
+        self.assertEqual([r.is_ok() for r in results], [x % 5 != 0 for x in range(100)])
+        self.assertEqual(
+            [r.unwrap() for r in results if r.is_ok()], [x for x in range(100) if x % 5]
+        )
+        self.assertIsInstance(results[0].unwrap_err(), ValueError)
+
+    def test_unpicklable_error(self):
+        results = list(try_map(fail_unpicklable, [1, 2], 1, processes=True))
+        error = results[0].unwrap_err()
+        self.assertIsInstance(error, RemoteError)
+        self.assertEqual(error.args, (f"{__name__}.Unpicklable", "boom"))
+
+    def test_existing_executor(self):
+        with ThreadPoolExecutor(4) as executor:
+            results = list(try_map(parse, map(str, range(10)), executor, chunksize=3))
+            self.assertEqual(results, [Ok(x) for x in range(10)])
+            # the executor belongs to the caller and is still usable
+            self.assertEqual(executor.submit(parse, "7").result(), 7)
+
+    def test_unordered(self):
+        results = list(try_map(slow_identity, [5, 0, 3], 3, ordered=False))
+        self.assertEqual(results, [Ok(0), Ok(3), Ok(5)])
+
+    def test_bases(self):
+        with self.assertRaises(ValueError):
+            list(try_map(parse, ["x"], 1, bases=(TypeError,)))
+
+    def test_bounded_window(self):
+        pulled = []
+
+        def numbers():
+            for x in range(10_000):
+                pulled.append(x)
+                yield x
+
+        for ordered in (True, False):
+            pulled.clear()
+            results = try_map(slow_identity, numbers(), 2, ordered=ordered)
+            self.assertEqual(next(results), Ok(0))
+            # two workers keep at most eight one-item chunks in flight
+            self.assertLessEqual(len(pulled), 10)
+            results.close()
@@ -0,0 +1,99 @@
+from unittest import TestCase
+
+from src.pyrust_alerycserrania import Err, Nothing, Ok, Some
+from src.pyrust_alerycserrania.pipeline import OptionPipeline, ResultPipeline
+
+
+def half(x: int):
+    return Some(x // 2) if x % 2 == 0 else Nothing()
+
+
+def checked_half(x: int):
+    return Ok(x // 2) if x % 2 == 0 else Err(f"{x} is odd")
+
+
+class TestOptionPipeline(TestCase):
+    def test_call(self):
+        pipeline = OptionPipeline().map(lambda x: x + 1).filter(lambda x: x > 2)
+        pipeline = pipeline.and_then(half)
+        self.assertEqual(pipeline(3), Some(2))
+        self.assertEqual(pipeline(0), Nothing())
+        self.assertEqual(pipeline(4), Nothing())
+
+    def test_same_as_combinators(self):
+        pipeline = (
+            OptionPipeline()
+            .map(lambda x: x * 3)
+            .filter(lambda x: x % 4 != 0)
+            .and_then(half)
+            .map_or(-1, lambda x: x + 100)
+        )
+        for x in range(50):
+            expected = (
+                Some(x)
+                .map(lambda x: x * 3)
+                .filter(lambda x: x % 4 != 0)
+                .and_then(half)
+                .map_or(-1, lambda x: x + 100)
+            )
+            self.assertEqual(pipeline(x), expected)
+
+    def test_stops_at_first_miss(self):
+        seen = []
+        pipeline = OptionPipeline().filter(lambda x: x > 0).inspect(seen.append)
+        self.assertEqual(list(pipeline.over([1, -1, 2])), [Some(1), Nothing(), Some(2)])
+        self.assertEqual(seen, [1, 2])
+
+    def test_terminals(self):
+        pipeline = OptionPipeline().and_then(half)
+        self.assertEqual(pipeline.unwrap_or(0)(4), 2)
+        self.assertEqual(pipeline.unwrap_or(0)(3), 0)
+        self.assertEqual(pipeline.map_or_else(lambda: "odd", str)(3), "odd")
+        self.assertEqual(pipeline.map_or_else(lambda: "odd", str)(4), "2")
+        self.assertRaises(TypeError, pipeline.unwrap_or(0).map, str)
+
+    def test_apply(self):
+        pipeline = OptionPipeline().map(lambda x: x + 1)
+        self.assertEqual(pipeline.apply(Some(1)), Some(2))
+        self.assertIs(pipeline.apply(Nothing()), Nothing())
+        self.assertEqual(pipeline.unwrap_or(0).apply(Nothing()), 0)
+
+    def test_reusable(self):
+        base = OptionPipeline().map(lambda x: x + 1)
+        doubled = base.map(lambda x: x * 2)
+        self.assertEqual(base(1), Some(2))
+        self.assertEqual(doubled(1), Some(4))
+        self.assertIs(doubled.compile(), doubled.compile())
+
+
+class TestResultPipeline(TestCase):
+    def test_call(self):
+        pipeline = ResultPipeline().map(lambda x: x + 1).and_then(checked_half)
+        self.assertEqual(pipeline(3), Ok(2))
+        self.assertEqual(pipeline(4), Err("5 is odd"))
+
+    def test_err_is_returned_as_is(self):
+        err = Err("boom")
+        pipeline = ResultPipeline().and_then(lambda _: err).map(lambda x: x + 1)
+        self.assertIs(pipeline(1), err)
+
+    def test_map_err(self):
+        pipeline = (
+            ResultPipeline()
+            .map_err(lambda e: "before " + e)
+            .and_then(checked_half)
+            .map_err(len)
+            .and_then(checked_half)
+            .map_err(lambda e: e * 10)
+        )
+        self.assertEqual(pipeline(4), Ok(1))
+        self.assertEqual(pipeline(3), Err(80))
+        self.assertEqual(pipeline(6), Err("3 is odd" * 10))
+        self.assertEqual(pipeline.apply(Err("x")), Err(80))
+
+    def test_terminals(self):
+        pipeline = ResultPipeline().and_then(checked_half)
+        self.assertEqual(pipeline.map_or(None, str)(4), "2")
+        self.assertEqual(pipeline.map_or(None, str)(3), None)
+        self.assertEqual(pipeline.unwrap_or(0).apply(Err("x")), 0)
+        self.assertEqual(pipeline.unwrap_or(0).apply(Ok(8)), 4)
@@ -1,6 +1,21 @@
+import bisect
+import functools
+import heapq
+import weakref
 from unittest import TestCase
 
-from src.pyrust_alerycserrania import Err, Nothing, Ok, Panic, Some, as_result
+from src.pyrust_alerycserrania import (
+    Capture,
+    Err,
+    Handlers,
+    Nothing,
+    Ok,
+    Panic,
+    Some,
+    as_result,
+    result_block,
+    sort_key,
+)
 
 
 class TestResult(TestCase):
@@ -12,6 +27,18 @@ class TestResult(TestCase):
         self.assertFalse(Some(""))
         self.assertFalse(Nothing())
 
+    def test_slots(self):
+        self.assertFalse(hasattr(Ok(5), "__dict__"))
+        self.assertFalse(hasattr(Err("aie"), "__dict__"))
+        self.assertRaises(TypeError, weakref.ref, Ok(5))
+
+        class WeakOk(Ok):
+            __slots__ = ("__weakref__",)
+
+        ok = WeakOk(5)
+        self.assertIs(weakref.ref(ok)(), ok)
+        self.assertEqual(ok, Ok(5))
+
     def test_eq(self):
         self.assertTrue(Ok(4) == Ok(4))
         self.assertFalse(Ok(4) == Ok(5))
@@ -29,6 +56,32 @@ class TestResult(TestCase):
         self.assertTrue(Err("aie") != Ok(5))
         self.assertTrue(Ok(5) != Err("aie"))
 
+    def test_hash(self):
+        self.assertEqual(hash(Ok(4)), hash(Ok(4)))
+        self.assertEqual(hash(Err("aie")), hash(Err("aie")))
+        self.assertEqual(len({Ok(4), Ok(4), Err(4), Some(4)}), 3)
+        self.assertEqual({Ok(4): "ok", Err(4): "err"}[Err(4)], "err")
+        self.assertRaises(TypeError, hash, Ok([4]))
+
+        calls = []
+
+        @functools.lru_cache
+        def cached(result):
+            calls.append(result)
+            return result.map_or(0, lambda x: x + 1)
+
+        self.assertEqual(cached(Ok(4)), 5)
+        self.assertEqual(cached(Ok(4)), 5)
+        self.assertEqual(cached(Err(4)), 0)
+        self.assertEqual(calls, [Ok(4), Err(4)])
+
+    def test_eq_other_types(self):
+        self.assertFalse(Ok(4) == Some(4))
+        self.assertFalse(Err(4) == Nothing())
+        self.assertFalse(Ok(4) == 4)
+        self.assertTrue(Ok(4) != 4)
+        self.assertTrue(Err(4) != Some(4))
+
     def test_lt(self):
         self.assertTrue(Ok(4) < Ok(5))
         self.assertFalse(Ok(4) < Ok(4))
@@ -76,6 +129,27 @@ class TestResult(TestCase):
         self.assertRaises(TypeError, lambda: Ok(4) > Ok("a"))
         self.assertRaises(TypeError, lambda: Ok(6) >= 5)
 
+    def test_compare_other_families(self):
+        for compare in ("__lt__", "__le__", "__gt__", "__ge__"):
+            self.assertIs(getattr(Ok(4), compare)(Some(4)), NotImplemented)
+            self.assertIs(getattr(Err(4), compare)(Nothing()), NotImplemented)
+        self.assertRaises(TypeError, lambda: Ok(4) > Some(4))
+        self.assertRaises(TypeError, lambda: Err(4) <= 4)
+
+    def test_sort_key(self):
+        results = [Err("b"), Ok(3), Err("a"), Ok(1), Ok(2)]
+        expected = [Ok(1), Ok(2), Ok(3), Err("a"), Err("b")]
+        self.assertEqual(sorted(results), expected)
+        self.assertEqual(sorted(results, key=sort_key), expected)
+        self.assertEqual(Ok(1).sort_key(), (2, 1))
+
+        heap = [(sort_key(result), result) for result in results]
+        heapq.heapify(heap)
+        self.assertEqual(heapq.heappop(heap)[1], Ok(1))
+
+        position = bisect.bisect_left(expected, sort_key(Err("a")), key=sort_key)
+        self.assertEqual(position, 3)
+
     def test_is_ok(self):
         self.assertTrue(Ok(5).is_ok())
         self.assertFalse(Err("oh no!").is_ok())
@@ -106,6 +180,28 @@ class TestResult(TestCase):
         self.assertEqual(Ok(2).map(lambda x: x * 2), Ok(4))
         self.assertEqual(Err("oh no!").map(lambda x: x * 2), Err("oh no!"))
 
+    def test_immutable(self):
+        ok, err = Ok(2), Err("oh no!")
+        with self.assertRaises(AttributeError):
+            ok.value = 3
+        with self.assertRaises(AttributeError):
+            err.error = "fine"
+        with self.assertRaises(AttributeError):
+            del ok.value
+        self.assertEqual(ok.map(lambda x: x * 2), Ok(4))
+        self.assertEqual(err.map_err(len), Err(6))
+        self.assertEqual((ok, err), (Ok(2), Err("oh no!")))
+
+    def test_map_in_place(self):
+        ok, err = Ok(2), Err("oh no!")
+        self.assertIs(ok.map_in_place(lambda x: x * 2), ok)
+        self.assertEqual(ok, Ok(4))
+        self.assertIs(ok.map_err_in_place(len), ok)
+        self.assertIs(err.map_err_in_place(len), err)
+        self.assertEqual(err, Err(6))
+        self.assertIs(err.map_in_place(lambda x: x * 2), err)
+        self.assertEqual(err, Err(6))
+
     def test_map_or(self):
         self.assertEqual(Ok(2).map_or("yes", lambda x: x * 2), 4)
         self.assertEqual(Err("oh no!").map_or("ah", lambda x: x * 2), "ah")
@@ -119,6 +215,55 @@ class TestResult(TestCase):
         self.assertEqual(Ok(2).map_err(lambda x: len(x)), Ok(2))
         self.assertEqual(Err("oh no!").map_err(lambda x: len(x)), Err(6))
 
+    def test_and(self):
+        self.assertEqual(Ok(2).and_(Ok("b")), Ok("b"))
+        self.assertEqual(Ok(2).and_(Err("late")), Err("late"))
+        self.assertEqual(Err("early").and_(Ok("b")), Err("early"))
+        self.assertEqual(Err("early").and_(Err("late")), Err("early"))
+
+    def test_and_then(self):
+        def half(x):
+            return Ok(x // 2) if x % 2 == 0 else Err(f"{x} is odd")
+
+        self.assertEqual(Ok(4).and_then(half), Ok(2))
+        self.assertEqual(Ok(4).and_then(half).and_then(half), Ok(1))
+        self.assertEqual(Ok(3).and_then(half), Err("3 is odd"))
+        self.assertEqual(Err("oh no!").and_then(half), Err("oh no!"))
+
+    def test_or(self):
+        self.assertEqual(Ok(2).or_(Err("late")), Ok(2))
+        self.assertEqual(Ok(2).or_(Ok(3)), Ok(2))
+        self.assertEqual(Err("early").or_(Ok(3)), Ok(3))
+        self.assertEqual(Err("early").or_(Err("late")), Err("late"))
+
+    def test_or_else(self):
+        self.assertEqual(Ok(2).or_else(lambda e: Ok(len(e))), Ok(2))
+        self.assertEqual(Err("oh no!").or_else(lambda e: Ok(len(e))), Ok(6))
+        self.assertEqual(Err("oh no!").or_else(lambda e: Err(len(e))), Err(6))
+
+    def test_unwrap_or(self):
+        self.assertEqual(Ok(2).unwrap_or(0), 2)
+        self.assertEqual(Err("oh no!").unwrap_or(0), 0)
+
+    def test_unwrap_or_else(self):
+        self.assertEqual(Ok(2).unwrap_or_else(len), 2)
+        self.assertEqual(Err("oh no!").unwrap_or_else(len), 6)
+
+    def test_flatten(self):
+        self.assertEqual(Ok(Ok(2)).flatten(), Ok(2))
+        self.assertEqual(Ok(Err("inner")).flatten(), Err("inner"))
+        self.assertEqual(Err("outer").flatten(), Err("outer"))
+        self.assertRaises(TypeError, Ok(5).flatten)
+        self.assertRaises(TypeError, Ok(Some(5)).flatten)
+
+    def test_iter(self):
+        self.assertEqual(list(Ok(2).iter()), [2])
+        self.assertEqual(list(Err("oh no!").iter()), [])
+
+    def test_bool_err(self):
+        self.assertTrue(Err("oh no!"))
+        self.assertFalse(Err(""))
+
     def test_inspect(self):
         self.assertEqual(Ok(4).inspect(lambda v: self.assertEqual(v, 4)), Ok(4))
         self.assertEqual(
@@ -133,16 +278,55 @@ class TestResult(TestCase):
             Ok(4).inspect_err(lambda _: self.fail("Nothing should not be inspected")),
             Ok(4),
         )
-        self.assertEqual(
-            Err("oh no!").inspect(lambda v: self.assertEqual(v, "oh no!")),
-            Err("oh no!"),
-        )
+        seen = []
+        self.assertEqual(Err("oh no!").inspect_err(seen.append), Err("oh no!"))
+        self.assertEqual(seen, ["oh no!"])
 
     def test_expect(self):
         self.assertEqual(Ok("value").expect("expected value"), "value")
         with self.assertRaises(Panic, msg="expected value"):
             Err(5).expect("expected value")
 
+    def test_expect_lazy_message(self):
+        def message(*args):
+            calls.append(args)
+            return "request %s failed" % args
+
+        calls = []
+        self.assertEqual(Ok(1).expect(message, "r-1"), 1)
+        self.assertEqual(Ok(1).expect("request %s failed", "r-1"), 1)
+        self.assertEqual(calls, [])
+
+        with self.assertRaises(Panic) as raised:
+            Err(5).expect(message, "r-1")
+        self.assertEqual(str(raised.exception), "request r-1 failed")
+        with self.assertRaises(Panic) as raised:
+            Err(5).expect("request %s failed after %d tries", "r-1", 3)
+        self.assertEqual(str(raised.exception), "request r-1 failed after 3 tries")
+        with self.assertRaises(Panic) as raised:
+            Err(5).expect("100% sure")
+        self.assertEqual(str(raised.exception), "100% sure")
+
+    def test_panic_context(self):
+        err = Err(5)
+        with self.assertRaises(Panic) as raised:
+            err.expect("expected value")
+        self.assertIs(raised.exception.variant, err)
+        self.assertEqual(raised.exception.payload, 5)
+        self.assertIsNone(raised.exception.__cause__)
+
+        with self.assertRaises(Panic) as raised:
+            Ok(5).unwrap_err()
+        self.assertEqual(raised.exception.payload, 5)
+        self.assertEqual(raised.exception.args, ())
+
+    def test_panic_chains_captured_exception(self):
+        result = as_result(int)("five")
+        with self.assertRaises(Panic) as raised:
+            result.unwrap()
+        self.assertIs(raised.exception.__cause__, result.unwrap_err())
+        self.assertIsInstance(raised.exception.payload, ValueError)
+
     def test_unwrap(self):
         self.assertEqual(Ok("value").unwrap(), "value")
         self.assertRaises(Panic, Err(5).unwrap)
@@ -156,6 +340,11 @@ class TestResult(TestCase):
         self.assertEqual(Err("value").unwrap_err(), "value")
         self.assertRaises(Panic, Ok(5).unwrap_err)
 
+    def test_transpose(self):
+        self.assertEqual(Ok(Some(5)).transpose(), Some(Ok(5)))
+        self.assertIs(Ok(Nothing()).transpose(), Nothing())
+        self.assertEqual(Err("aie").transpose(), Some(Err("aie")))
+
     def test_as_result(self):
         @as_result
         def my_func(x: int):
@@ -180,3 +369,87 @@ class TestResult(TestCase):
         self.assertEqual(my_func(5), Ok(10))
         self.assertEqual(str(my_func(-1).unwrap_err()), "x must be greater than 0")
         self.assertRaises(Exception, my_func, -6)
+
+    def test_as_result_reraise(self):
+        def fail():
+            raise KeyError("k")
+
+        try:
+            as_result((TypeError,))(fail)()
+        except KeyError as exc:
+            tb = exc.__traceback__
+        else:
+            self.fail("KeyError was not raised")
+        frames = []
+        while tb is not None:
+            frames.append(tb.tb_frame.f_code.co_name)
+            tb = tb.tb_next
+        self.assertEqual(frames, ["test_as_result_reraise", "wrapper", "fail"])
+
+    def test_fold(self):
+        self.assertEqual(Ok(2).fold(lambda x: x * 10, len), 20)
+        self.assertEqual(Err("aie").fold(lambda x: x * 10, len), 3)
+
+    def test_fold_with(self):
+        handlers = Handlers(on_ok=lambda x: ("ok", x), on_err=lambda e: ("err", e))
+        self.assertEqual(Ok(1).fold_with(handlers), ("ok", 1))
+        self.assertEqual(Err(2).fold_with(handlers), ("err", 2))
+        self.assertEqual(list(map(handlers, [Ok(1), Err(2)])), [("ok", 1), ("err", 2)])
+
+    def test_q(self):
+        self.assertEqual(Ok(1).q(), 1)
+        with self.assertRaises(BaseException):
+            Err("aie").q()
+
+    def test_result_block(self):
+        steps = []
+
+        @result_block
+        def add(a, b):
+            x = a.q()
+            steps.append(x)
+            return Ok(x + b.q())
+
+        self.assertEqual(add(Ok(1), Ok(2)), Ok(3))
+        self.assertEqual(add(Err("a"), Ok(2)), Err("a"))
+        self.assertEqual(add(Ok(1), Err("b")), Err("b"))
+        self.assertEqual(steps, [1, 1])
+
+    def test_result_block_ignores_except_exception(self):
+        @result_block
+        def guarded(result):
+            try:
+                return Ok(result.q())
+            except Exception:
+                return Ok("caught")
+
+        self.assertEqual(guarded(Err("e")), Err("e"))
+
+    def test_result_block_nested(self):
+        @result_block
+        def inner(result):
+            return Ok(result.q() * 2)
+
+        @result_block
+        def outer(result):
+            return Ok(inner(result).is_ok())
+
+        self.assertEqual(outer(Ok(1)), Ok(True))
+        self.assertEqual(outer(Err("e")), Ok(False))
+
+    def test_capture(self):
+        with Capture(ValueError) as captured:
+            captured.set(int("12"))
+        self.assertEqual(captured.result, Ok(12))
+
+        with Capture(ValueError) as captured:
+            captured.set(int("twelve"))
+        self.assertIsInstance(captured.result.unwrap_err(), ValueError)
+
+        with Capture() as captured:
+            pass
+        self.assertEqual(captured.result, Ok(None))
+
+        with self.assertRaises(KeyError):
+            with Capture(ValueError) as captured:
+                raise KeyError("k")
@@ -0,0 +1,85 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from src.pyrust_alerycserrania import Err, Ok, as_result
+from src.pyrust_alerycserrania.errors import ErrorRecord, summarize
+from src.pyrust_alerycserrania.spill import SpillSink, SpillStats, replay
+
+
+class TestSpill(TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.directory = tmp.name
+
+    def test_forwards_oks_and_spills_errs(self):
+        results = [Ok(1), Err("a"), Ok(2), Err({"b": [1]}), Ok(3)]
+        with SpillSink(self.directory, buffer_size=1) as sink:
+            self.assertEqual(list(sink(results)), [1, 2, 3])
+        self.assertEqual(sink.stats(), SpillStats(3, 2, 1, sink.bytes))
+        self.assertEqual(list(sink.replay()), [Err("a"), Err({"b": [1]})])
+        self.assertEqual(list(replay(*sink.paths)), [Err("a"), Err({"b": [1]})])
+
+    def test_lazy(self):
+        sink = SpillSink(self.directory)
+        forwarded = sink(iter([Ok(1), Err("a"), Ok(2)]))
+        self.assertEqual(sink.stats(), SpillStats(0, 0, 0, 0))
+        self.assertEqual(next(forwarded), 1)
+        self.assertEqual(sink.stats().oks, 1)
+        # errors stay buffered until the buffer fills or the stream ends
+        self.assertEqual(next(forwarded), 2)
+        self.assertEqual(os.listdir(self.directory), [])
+        sink.close()
+        self.assertEqual(list(sink.replay()), [Err("a")])
+
+    def test_rotation(self):
+        results = [Err(i) for i in range(10)]
+        with SpillSink(self.directory, buffer_size=2, max_bytes=1) as sink:
+            self.assertEqual(list(sink(results)), [])
+        self.assertEqual(len(sink.paths), 5)
+        self.assertEqual(
+            sorted(os.listdir(self.directory)),
+            [f"errors-0000{i}.jsonl" for i in range(5)],
+        )
+        self.assertEqual(list(sink.replay()), results)
+
+    def test_wire_format(self):
+        results = [Err(KeyError("k")), Ok(1), Err(ValueError("v"))]
+        with SpillSink(self.directory, file_format="wire", buffer_size=1) as sink:
+            self.assertEqual(list(sink(results)), [1])
+        self.assertTrue(sink.paths[0].endswith(".pyrs"))
+        spilled = [err.unwrap_err() for err in replay(*sink.paths)]
+        self.assertEqual([type(exc) for exc in spilled], [KeyError, ValueError])
+
+    def test_summarized_errors(self):
+        parse = as_result((ValueError,), capture=summarize(frames=1))(int)
+        results = list(map(parse, ["1", "x"]))
+        with SpillSink(self.directory, loads=ErrorRecord.from_json) as sink:
+            self.assertEqual(list(sink(results)), [1])
+        self.assertEqual(list(sink.replay()), [results[1]])
+        self.assertIsInstance(results[1].error, ErrorRecord)
+
+        # without loads, JSON lines come back as plain JSON values
+        [err] = replay(*sink.paths)
+        self.assertEqual(
+            err.error, list(results[1].error[:2]) + [list(results[1].error.frames)]
+        )
+
+    def test_exceptions(self):
+        results = list(map(as_result(int), ["1", "x"]))
+        with SpillSink(self.directory, loads=ErrorRecord.from_json) as sink:
+            self.assertEqual(list(sink(results)), [1])
+        [err] = sink.replay()
+        self.assertEqual(err.unwrap_err(), ErrorRecord.from_exception(results[1].error))
+
+    def test_unserializable(self):
+        sink = SpillSink(self.directory)
+        with self.assertRaises(TypeError):
+            list(sink([Err(object())]))
+        sink.close()
+        self.assertEqual(sink.stats().bytes, 0)
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            SpillSink(self.directory, file_format="csv")
@@ -0,0 +1,65 @@
+import copy
+import pickle
+from unittest import TestCase, skipUnless
+
+from src.pyrust_alerycserrania import Err, Nothing, Ok, Some
+from src.pyrust_alerycserrania.wire import JSON, MsgpackCodec, decode, encode
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+class TestPickle(TestCase):
+    def test_round_trip(self):
+        for item in (Ok(1), Err("e"), Some([1, 2]), Nothing()):
+            self.assertEqual(pickle.loads(pickle.dumps(item)), item)
+            self.assertEqual(copy.copy(item), item)
+
+    def test_reduce(self):
+        self.assertEqual(Ok(1).__reduce__(), (Ok, (1,)))
+        self.assertEqual(Err(1).__reduce__(), (Err, (1,)))
+        self.assertEqual(Some(1).__reduce__(), (Some, (1,)))
+
+
+class TestWire(TestCase):
+    items = [Ok(1), Err("e"), Some({"a": 1}), Nothing(), Some(None), Ok([1, 2])]
+
+    def test_round_trip(self):
+        self.assertEqual(decode(encode(self.items)), self.items)
+        self.assertEqual(decode(encode([])), [])
+
+    def test_homogeneous(self):
+        oks = [Ok(x) for x in range(10)]
+        self.assertEqual(decode(encode(oks)), oks)
+        self.assertEqual(decode(encode([Nothing()] * 3)), [Nothing()] * 3)
+
+    def test_json(self):
+        data = encode(self.items, JSON)
+        self.assertIn(b'[1,"e",{"a":1},null,[1,2]]', data)
+        self.assertEqual(decode(data, JSON), self.items)
+
+    def test_compact(self):
+        oks = [Ok(x) for x in range(1000)]
+        self.assertLess(len(encode(oks)), len(pickle.dumps(oks)) / 2)
+
+    def test_bad_buffer(self):
+        self.assertRaises(ValueError, decode, b"NOPE\x01\x00\x00\x00\x00")
+        self.assertRaises(ValueError, decode, encode(self.items)[:5])
+        self.assertRaises(ValueError, decode, b"")
+
+    def test_memoryview(self):
+        self.assertEqual(decode(memoryview(encode(self.items))), self.items)
+        data = memoryview(encode(self.items, JSON))
+        self.assertEqual(decode(data, JSON), self.items)
+
+    def test_payload_count(self):
+        data = encode([Ok(1), Nothing(), Err(2)], JSON)
+        self.assertRaises(ValueError, decode, data.replace(b"[1,2]", b"[1]"), JSON)
+        self.assertRaises(ValueError, decode, data.replace(b"[1,2]", b"[1,2,3]"), JSON)
+
+    @skipUnless(msgpack, "msgpack is not installed")
+    def test_msgpack(self):
+        codec = MsgpackCodec()
+        self.assertEqual(decode(encode(self.items, codec), codec), self.items)